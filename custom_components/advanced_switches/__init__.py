@@ -2,15 +2,32 @@
 from __future__ import annotations
 
 import logging
+from asyncio import TimerHandle
+from bisect import bisect_right
 from collections import deque
 from datetime import date, datetime, time, timedelta
+from math import isfinite
 from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.const import (
+    STATE_OFF as HA_STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity_registry as er
-from homeassistant.helpers.event import async_call_later, async_track_time_change, async_track_time_interval
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_change,
+    async_track_time_interval,
+)
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_AVG_SESSION_DURATION_S,
@@ -72,19 +89,32 @@ from .const import (
     DEFAULT_SESSION_END_GRACE_S,
     DEFAULT_SESSION_END_ON_STANDBY,
     DEFAULT_STANDBY_THRESHOLD_W,
+    DEVICE_STATE_NAMES,
     DOMAIN,
+    MIN_SMOOTHING_READINGS,
     MODE_SIMPLE,
     MODE_STANDBY,
+    NOTIFY_COALESCE_S,
     PLATFORMS,
+    POWER_DEBOUNCE_S,
     SESSION_HISTORY_SIZE,
-    STATE_ACTIVE,
     STATE_BLOCKED,
-    STATE_OFF,
-    STATE_STANDBY,
+    TIMER_TOLERANCE_S,
+    DeviceState,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Power zones relative to the standby and active thresholds
+_ZONE_LOW = 0  # Below standby threshold
+_ZONE_STANDBY = 1  # Between standby and active threshold
+_ZONE_ACTIVE = 2  # At or above active threshold
+
+MINUTES_PER_DAY = 24 * 60
+
+# Device states that count as on
+_ON_STATES = frozenset({DeviceState.STANDBY, DeviceState.ACTIVE})
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Advanced Switches from a config entry."""
@@ -120,6 +150,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class AdvancedSwitchController:
     """Controller for Advanced Switches."""
 
+    __slots__ = (
+        "_active_standby_delay_s", "_active_threshold_w", "_auto_off_at",
+        "_auto_off_enabled", "_auto_off_minutes", "_auto_off_standby_enabled",
+        "_auto_off_standby_minutes", "_avg_session_duration_s",
+        "_avg_session_energy_kwh", "_control_binary_sensor", "_current_energy",
+        "_current_power", "_device_info", "_device_name", "_energy_available",
+        "_energy_entity", "_energy_today_kwh", "_energy_total_kwh",
+        "_history_duration_sum", "_history_energy_sum", "_last_energy_raw",
+        "_last_notify_key", "_last_power_eval", "_last_session_duration_s",
+        "_last_session_energy_kwh", "_last_session_peak_power_w", "_min_duration_s",
+        "_mode", "_mode_handler", "_notify_forced", "_notify_handle", "_off_delay_s",
+        "_off_timer_deadline", "_off_timer_fires_at", "_on_delay_s",
+        "_on_timer_deadline", "_on_timer_fires_at", "_pending_energy_raw",
+        "_pending_session_end", "_pending_target_state", "_persistence_cache",
+        "_power_available", "_power_debouncer", "_power_entity", "_power_smoothing_s",
+        "_power_sum", "_power_thresholds", "_power_times", "_power_values",
+        "_remove_listeners", "_schedule_binary_sensor", "_schedule_blocked",
+        "_schedule_bounds", "_schedule_days", "_schedule_enabled", "_schedule_end",
+        "_schedule_start", "_session_end_grace_s", "_session_end_on_standby",
+        "_session_history", "_session_history_cache", "_session_peak_power",
+        "_session_start_energy", "_session_start_monotonic", "_session_start_time",
+        "_sessions_today", "_sessions_total", "_source_device_id",
+        "_source_device_identifiers", "_source_device_identifiers_cached",
+        "_standby_threshold_w", "_state", "_state_restored", "_state_signal",
+        "_switch_entity", "_switch_service_data", "_timers", "_today_date",
+        "_update_signal", "_was_on_before_schedule_off", "entry", "hass",
+    )
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the controller."""
         self.hass = hass
@@ -128,12 +186,18 @@ class AdvancedSwitchController:
         # Configuration
         self._device_name: str = entry.data[CONF_DEVICE_NAME]
         self._switch_entity: str = entry.data[CONF_SWITCH_ENTITY]
+        # Service data for switch calls (shared, never mutated)
+        self._switch_service_data: dict[str, str] = {"entity_id": self._switch_entity}
         self._power_entity: str = entry.data[CONF_POWER_ENTITY]
         self._energy_entity: str = entry.data.get(CONF_ENERGY_ENTITY, "")
         self._mode: str = entry.data[CONF_MODE]
 
         # Get source device ID for device linking
         self._source_device_id: str | None = self._get_source_device_id()
+        # Source device identifiers, looked up once on first use
+        self._source_device_identifiers: set[tuple[str, str]] | None = None
+        self._source_device_identifiers_cached: bool = False
+        self._device_info: dr.DeviceInfo | None = None  # Built on first use
 
         # Schedule configuration
         self._schedule_enabled: bool = entry.data.get(
@@ -148,6 +212,8 @@ class AdvancedSwitchController:
         self._schedule_days: list[int] = entry.data.get(
             CONF_SCHEDULE_DAYS, DEFAULT_SCHEDULE_DAYS
         )
+        # Allowed minute-of-week intervals as flat sorted boundaries
+        self._schedule_bounds: tuple[int, ...] = self._build_schedule_bounds()
         self._schedule_binary_sensor: str = entry.data.get(
             CONF_SCHEDULE_BINARY_SENSOR, ""
         )
@@ -178,22 +244,24 @@ class AdvancedSwitchController:
 
         # Load mode-specific parameters
         if self._mode == MODE_SIMPLE:
-            self._active_threshold_w: float = entry.data.get(
-                CONF_ACTIVE_THRESHOLD_W, DEFAULT_ACTIVE_THRESHOLD_W
+            self._active_threshold_w: float = float(
+                entry.data.get(CONF_ACTIVE_THRESHOLD_W, DEFAULT_ACTIVE_THRESHOLD_W)
             )
             self._on_delay_s: int = entry.data.get(CONF_ON_DELAY_S, DEFAULT_ON_DELAY_S)
             self._off_delay_s: int = entry.data.get(CONF_OFF_DELAY_S, DEFAULT_OFF_DELAY_S)
-            self._min_duration_s: int = entry.data.get(CONF_MIN_ACTIVE_S, DEFAULT_MIN_ACTIVE_S)
-            self._standby_threshold_w: float = 0
+            self._min_duration_s: float = float(
+                entry.data.get(CONF_MIN_ACTIVE_S, DEFAULT_MIN_ACTIVE_S)
+            )
+            self._standby_threshold_w: float = 0.0
             self._session_end_grace_s: int = self._off_delay_s
             self._active_standby_delay_s: int = self._on_delay_s  # Not used in simple mode
             self._session_end_on_standby: bool = False  # Not used in simple mode
         else:  # Standby mode
-            self._standby_threshold_w: float = entry.data.get(
-                CONF_STANDBY_THRESHOLD_W, DEFAULT_STANDBY_THRESHOLD_W
+            self._standby_threshold_w: float = float(
+                entry.data.get(CONF_STANDBY_THRESHOLD_W, DEFAULT_STANDBY_THRESHOLD_W)
             )
-            self._active_threshold_w: float = entry.data.get(
-                CONF_ACTIVE_THRESHOLD_W, DEFAULT_ACTIVE_THRESHOLD_W_STANDBY
+            self._active_threshold_w: float = float(
+                entry.data.get(CONF_ACTIVE_THRESHOLD_W, DEFAULT_ACTIVE_THRESHOLD_W_STANDBY)
             )
             self._on_delay_s: int = entry.data.get(CONF_ON_DELAY_S, DEFAULT_ON_DELAY_S)
             self._off_delay_s: int = entry.data.get(CONF_OFF_DELAY_S, DEFAULT_OFF_DELAY_S)
@@ -203,20 +271,53 @@ class AdvancedSwitchController:
             self._session_end_grace_s: int = entry.data.get(
                 CONF_SESSION_END_GRACE_S, DEFAULT_SESSION_END_GRACE_S
             )
-            self._min_duration_s: int = entry.data.get(CONF_MIN_SESSION_S, DEFAULT_MIN_SESSION_S)
+            self._min_duration_s: float = float(
+                entry.data.get(CONF_MIN_SESSION_S, DEFAULT_MIN_SESSION_S)
+            )
             self._session_end_on_standby: bool = entry.data.get(
                 CONF_SESSION_END_ON_STANDBY, DEFAULT_SESSION_END_ON_STANDBY
             )
 
-        # Power smoothing - store (timestamp, power) tuples
-        self._power_readings: deque[tuple[datetime, float]] = deque()
+        # Thresholds bounding the power zones (see _ZONE_*)
+        self._power_thresholds: tuple[float, float] = (
+            self._standby_threshold_w,
+            self._active_threshold_w,
+        )
+        # (state, zone) of the last standby mode evaluation
+        self._last_power_eval: tuple[DeviceState, int] | None = None
+
+        # Power smoothing - parallel buffers of loop-time timestamps and power
+        self._power_times: deque[float] = deque()
+        self._power_values: deque[float] = deque()
+        self._power_sum: float = 0.0  # Running sum of buffered readings
+
+        # Collapse bursts of power updates into one state machine evaluation
+        self._power_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=POWER_DEBOUNCE_S,
+            immediate=True,
+            function=self._process_power,
+        )
+
+        # State machine handler for the configured mode
+        self._mode_handler: Callable[[float, bool], None] = (
+            self._handle_simple_mode
+            if self._mode == MODE_SIMPLE
+            else self._handle_standby_mode
+        )
 
         # Current state
-        self._state: str = STATE_OFF
+        self._state: DeviceState = DeviceState.OFF
         self._session_start_time: datetime | None = None
+        self._session_start_monotonic: float = 0.0  # Loop time at session start
         self._session_start_energy: float | None = None
         self._current_energy: float | None = None
         self._current_power: float = 0.0
+        # Last raw energy state, to skip repeated readings
+        self._last_energy_raw: str | None = None
+        # Energy state not parsed yet, only read at session boundaries
+        self._pending_energy_raw: str | None = None
         self._power_available: bool = True
         self._energy_available: bool = True
         self._schedule_blocked: bool = False
@@ -225,15 +326,18 @@ class AdvancedSwitchController:
         # Session tracking - Peak power
         self._session_peak_power: float = 0.0
 
-        # Timers
-        self._pending_on_timer: Any | None = None
-        self._pending_off_timer: Any | None = None
-        self._pending_target_state: str | None = None
-        self._auto_off_timer: Any | None = None
+        # Timers - cancel handles of the armed timers, keyed by timer name
+        self._timers: dict[str, Callable[[], None]] = {}
+        self._pending_target_state: DeviceState | None = None
+        # Deadlines (loop time) of the on/off timers; None when not pending.
+        # Armed handles are left running when a timer is cancelled or
+        # restarted and re-check the deadline when they fire.
+        self._on_timer_deadline: float | None = None
+        self._on_timer_fires_at: float = 0.0
+        self._off_timer_deadline: float | None = None
+        self._off_timer_fires_at: float = 0.0
         self._auto_off_at: datetime | None = None  # When auto-off will trigger
         self._pending_session_end: bool = False  # Ignore fluctuations during grace period
-        self._pending_standby_end_timer: Any | None = None  # For Waschmaschine mode
-        self._standby_auto_off_timer: Any | None = None  # Auto-off after standby
 
         # Persistent statistics
         self._sessions_total: int = 0
@@ -243,29 +347,54 @@ class AdvancedSwitchController:
         self._last_session_duration_s: int | None = None
         self._last_session_energy_kwh: float | None = None
         self._last_session_peak_power_w: float | None = None
-        self._today_date: date = date.today()
+        self._today_date: date = self._today()
         self._state_restored: bool = False
 
-        # Session history (last N sessions)
-        self._session_history: list[dict[str, Any]] = []
+        # Session history (last N sessions, newest first)
+        self._session_history: deque[dict[str, Any]] = deque(maxlen=SESSION_HISTORY_SIZE)
+        self._history_duration_sum: float = 0.0  # Running sums over the history
+        self._history_energy_sum: float = 0.0
+        # Serialized history, built on first read after a change
+        self._session_history_cache: list[dict[str, Any]] | None = None
 
         # Average values (calculated from history)
         self._avg_session_duration_s: float | None = None
         self._avg_session_energy_kwh: float | None = None
 
-        # Entity update listeners
-        self._entity_listeners: list[Callable[[], None]] = []
+        # Entity updates (dispatcher signal)
+        self._update_signal: str = f"{DOMAIN}_{entry.entry_id}_update"
+        self._state_signal: str = f"{DOMAIN}_{entry.entry_id}_state"
+        self._last_notify_key: tuple | None = None  # Observable state at last notify
+        self._notify_handle: TimerHandle | None = None  # Scheduled notification
+        self._notify_forced: bool = False
+        self._persistence_cache: dict[str, Any] | None = None
         self._remove_listeners: list[Callable[[], None]] = []
 
     @staticmethod
     def _parse_time(time_str: str) -> time:
-        """Parse time string to time object."""
+        """Parse time string ("HH:MM" or "HH:MM:SS") to time object."""
         try:
-            parts = time_str.split(":")
-            return time(int(parts[0]), int(parts[1]))
-        except (ValueError, IndexError):
+            return time.fromisoformat(time_str).replace(second=0, microsecond=0)
+        except (ValueError, TypeError):
             return time(6, 0)
 
+    @staticmethod
+    def _today() -> date:
+        """Return the current date in the Home Assistant time zone."""
+        return dt_util.now().date()
+
+    @staticmethod
+    def _parse_power(power_str: str) -> float | None:
+        """Parse a power state, None if it is not a finite number.
+
+        NaN or infinity would poison the running sum of the smoothing buffer.
+        """
+        try:
+            power = float(power_str)
+        except ValueError:
+            return None
+        return power if isfinite(power) else None
+
     def _get_source_device_id(self) -> str | None:
         """Get the device ID from the source switch entity."""
         entity_registry = er.async_get(self.hass)
@@ -280,25 +409,64 @@ class AdvancedSwitchController:
         return None
 
     def get_source_device_identifiers(self) -> set[tuple[str, str]] | None:
-        """Get the identifiers from the source device."""
-        if not self._source_device_id:
-            return None
-        device_registry = dr.async_get(self.hass)
-        device = device_registry.async_get(self._source_device_id)
-        if device and device.identifiers:
-            _LOGGER.debug(
-                "%s: Using source device identifiers %s",
-                self._device_name,
-                device.identifiers,
-            )
-            return device.identifiers
-        return None
+        """Get the identifiers from the source device.
+
+        The source device cannot change without reloading the entry,
+        so the registry is only queried once.
+        """
+        if self._source_device_identifiers_cached:
+            return self._source_device_identifiers
+
+        identifiers: set[tuple[str, str]] | None = None
+        if self._source_device_id:
+            device_registry = dr.async_get(self.hass)
+            device = device_registry.async_get(self._source_device_id)
+            if device and device.identifiers:
+                _LOGGER.debug(
+                    "%s: Using source device identifiers %s",
+                    self._device_name,
+                    device.identifiers,
+                )
+                identifiers = device.identifiers
+
+        self._source_device_identifiers = identifiers
+        self._source_device_identifiers_cached = True
+        return identifiers
+
+    @property
+    def device_info(self) -> dr.DeviceInfo:
+        """Return the device info shared by all entities of this entry.
+
+        Links to the source device if available, otherwise to a virtual device.
+        """
+        if self._device_info is None:
+            source_identifiers = self.get_source_device_identifiers()
+            if source_identifiers:
+                self._device_info = dr.DeviceInfo(identifiers=source_identifiers)
+            else:
+                self._device_info = dr.DeviceInfo(
+                    identifiers={(DOMAIN, self.entry.entry_id)},
+                    name=self._device_name,
+                    manufacturer="Advanced Switches",
+                    model="Virtual Device",
+                )
+        return self._device_info
 
     @property
     def source_device_id(self) -> str | None:
         """Return the source device ID for device linking."""
         return self._source_device_id
 
+    @property
+    def update_signal(self) -> str:
+        """Return the dispatcher signal sent when entities should update."""
+        return self._update_signal
+
+    @property
+    def state_signal(self) -> str:
+        """Return the dispatcher signal sent when the exposed state changes."""
+        return self._state_signal
+
     @property
     def device_name(self) -> str:
         """Return the device name."""
@@ -314,7 +482,7 @@ class AdvancedSwitchController:
         """Return the current state."""
         if self._schedule_blocked:
             return STATE_BLOCKED
-        return self._state
+        return DEVICE_STATE_NAMES[self._state]
 
     @property
     def switch_entity(self) -> str:
@@ -371,38 +539,32 @@ class AdvancedSwitchController:
 
         Uses time-based window and periodic sampling for stable values.
         With 2-second sampling and 60-second window, we get ~30 readings.
+        The sum of the buffered readings is maintained incrementally.
+        Full precision is kept here; sensors round when exposing the value.
         """
-        if self._power_smoothing_s <= 0 or not self._power_readings:
-            return self._current_power
-
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=self._power_smoothing_s)
-
-        # Get readings within time window
-        valid_readings = [p for t, p in self._power_readings if t >= cutoff]
-
-        # Need minimum readings for stability (at least 5 readings)
-        if len(valid_readings) < 5:
-            # Use last N readings from buffer
-            all_readings = [p for _, p in self._power_readings]
-            valid_readings = all_readings[-max(5, len(all_readings)):]
-
-        if not valid_readings:
+        if self._power_smoothing_s <= 0 or not self._power_values:
             return self._current_power
 
         # Simple moving average
-        avg = sum(valid_readings) / len(valid_readings)
-        return round(avg, 1)
+        return self._power_sum / len(self._power_values)
 
     def _add_power_reading(self, power: float) -> None:
         """Add a new power reading to the buffer."""
-        now = datetime.now()
-        self._power_readings.append((now, power))
-
-        # Keep enough readings for smoothing (at least 60 readings = 2 min at 2s interval)
-        max_readings = max(120, int(self._power_smoothing_s) + 30)
-        while len(self._power_readings) > max_readings:
-            self._power_readings.popleft()
+        now = self.hass.loop.time()
+        self._power_times.append(now)
+        self._power_values.append(power)
+        self._power_sum += power
+        self._evict_power_readings(now)
+
+    def _evict_power_readings(self, now: float) -> None:
+        """Drop readings outside the smoothing window (keeping a minimum)."""
+        cutoff = now - self._power_smoothing_s
+        times = self._power_times
+        values = self._power_values
+        # Need minimum readings for stability (at least 5 readings)
+        while len(times) > MIN_SMOOTHING_READINGS and times[0] < cutoff:
+            times.popleft()
+            self._power_sum -= values.popleft()
 
     @property
     def session_peak_power(self) -> float:
@@ -414,19 +576,34 @@ class AdvancedSwitchController:
         """Return current session duration in seconds."""
         if self._session_start_time is None:
             return None
-        return int((datetime.now() - self._session_start_time).total_seconds())
+        return int(self.hass.loop.time() - self._session_start_monotonic)
 
     @property
     def current_session_energy_kwh(self) -> float | None:
         """Return current session energy consumption."""
-        if self._session_start_energy is None or self._current_energy is None:
+        if self._session_start_energy is None:
+            return None
+        current_energy = self._get_current_energy()
+        if current_energy is None:
             return None
-        return max(0.0, self._current_energy - self._session_start_energy)
+        return max(0.0, current_energy - self._session_start_energy)
 
     @property
     def session_history(self) -> list[dict[str, Any]]:
-        """Return session history."""
-        return self._session_history
+        """Return session history (timestamps as ISO strings)."""
+        if self._session_history_cache is None:
+            self._session_history_cache = [
+                self._serialize_session(session) for session in self._session_history
+            ]
+        return self._session_history_cache
+
+    @staticmethod
+    def _serialize_session(session: dict[str, Any]) -> dict[str, Any]:
+        """Return a session record with ISO formatted timestamps."""
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in session.items()
+        }
 
     @property
     def avg_session_duration_s(self) -> float | None:
@@ -493,43 +670,57 @@ class AdvancedSwitchController:
         """Return auto-off standby timeout in minutes."""
         return self._auto_off_standby_minutes
 
-    def _is_within_schedule(self) -> bool:
-        """Check if current time is within the allowed schedule."""
+    def _build_schedule_bounds(self) -> tuple[int, ...]:
+        """Build the allowed schedule as sorted minute-of-week boundaries.
+
+        Returns (start, end, start, end, ...) of half-open intervals, so a
+        minute is inside the schedule if it has an odd number of
+        boundaries at or before it. The end minute itself is still inside
+        the schedule, so start == end allows just that one minute.
+        """
+        start = self._schedule_start.hour * 60 + self._schedule_start.minute
+        # First minute after the schedule, as the end minute is inclusive
+        end = self._schedule_end.hour * 60 + self._schedule_end.minute + 1
+        bounds: list[int] = []
+        for day in sorted(set(self._schedule_days)):
+            day_start = day * MINUTES_PER_DAY
+            if start < end:
+                # Normal range (e.g., 06:00 - 22:00)
+                intervals = [(start, end)]
+            else:
+                # Overnight range (e.g., 22:00 - 06:00), both parts on this day
+                intervals = [(0, end), (start, MINUTES_PER_DAY)]
+            for interval_start, interval_end in intervals:
+                if interval_start < interval_end:
+                    bounds += (day_start + interval_start, day_start + interval_end)
+        return tuple(bounds)
+
+    def _is_within_schedule(self, now: datetime | None = None) -> bool:
+        """Check if the time (default: now) is within the allowed schedule."""
         # Check binary sensor (if configured)
         if self._schedule_binary_sensor:
             bs_state = self.hass.states.get(self._schedule_binary_sensor)
-            if bs_state and bs_state.state != "on":
+            if bs_state and bs_state.state != STATE_ON:
                 return False
 
         if not self._schedule_enabled:
             # If only binary sensor is configured (no time schedule), binary sensor check above is sufficient
             return True
 
-        now = datetime.now()
-        current_time = now.time()
-        current_day = now.weekday()
-
-        # Check if today is an allowed day
-        if current_day not in self._schedule_days:
-            return False
+        if now is None:
+            now = dt_util.now()
+        minute_of_week = now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+        return bisect_right(self._schedule_bounds, minute_of_week) % 2 == 1
 
-        # Check if current time is within range
-        if self._schedule_start <= self._schedule_end:
-            # Normal range (e.g., 06:00 - 22:00)
-            return self._schedule_start <= current_time <= self._schedule_end
-        else:
-            # Overnight range (e.g., 22:00 - 06:00)
-            return current_time >= self._schedule_start or current_time <= self._schedule_end
-
-    async def _enforce_schedule(self) -> None:
+    async def _enforce_schedule(self, now: datetime | None = None) -> None:
         """Enforce the schedule by turning off/on switch based on time."""
         was_blocked = self._schedule_blocked
-        self._schedule_blocked = not self._is_within_schedule()
+        self._schedule_blocked = not self._is_within_schedule(now)
 
         if self._schedule_blocked and not was_blocked:
             # Just entered blocked period - check if switch is currently ON
             switch_state = self.hass.states.get(self._switch_entity)
-            switch_is_on = switch_state and switch_state.state == "on"
+            switch_is_on = switch_state and switch_state.state == STATE_ON
 
             if switch_is_on:
                 # Switch was ON, turn it off and remember
@@ -541,11 +732,11 @@ class AdvancedSwitchController:
                 await self.hass.services.async_call(
                     "switch",
                     "turn_off",
-                    {"entity_id": self._switch_entity},
+                    self._switch_service_data,
                     blocking=True,
                 )
                 # End any active session
-                if self._state != STATE_OFF:
+                if self._state != DeviceState.OFF:
                     self._end_session()
             else:
                 # Switch was OFF, don't remember
@@ -567,7 +758,7 @@ class AdvancedSwitchController:
                 await self.hass.services.async_call(
                     "switch",
                     "turn_on",
-                    {"entity_id": self._switch_entity},
+                    self._switch_service_data,
                     blocking=True,
                 )
                 self._was_on_before_schedule_off = False
@@ -584,37 +775,29 @@ class AdvancedSwitchController:
             _LOGGER.debug("%s: Control sensor ON but blocked by schedule", self._device_name)
             return
         switch_state = self.hass.states.get(self._switch_entity)
-        if switch_state and switch_state.state != "on":
+        if switch_state and switch_state.state != STATE_ON:
             _LOGGER.info("%s: Control sensor ON → turning switch ON", self._device_name)
             await self.hass.services.async_call(
                 "switch", "turn_on",
-                {"entity_id": self._switch_entity},
+                self._switch_service_data,
                 blocking=True,
             )
 
     async def _control_switch_off(self) -> None:
         """Turn switch OFF (triggered by control binary sensor)."""
         switch_state = self.hass.states.get(self._switch_entity)
-        if switch_state and switch_state.state == "on":
+        if switch_state and switch_state.state == STATE_ON:
             _LOGGER.info("%s: Control sensor OFF → turning switch OFF", self._device_name)
             await self.hass.services.async_call(
                 "switch", "turn_off",
-                {"entity_id": self._switch_entity},
+                self._switch_service_data,
                 blocking=True,
             )
-            if self._state != STATE_OFF:
+            if self._state != DeviceState.OFF:
                 self._end_session()
             self._notify_entities()
 
-    def register_entity_listener(self, callback_fn: Callable[[], None]) -> None:
-        """Register a callback for entity updates."""
-        self._entity_listeners.append(callback_fn)
-
-    def unregister_entity_listener(self, callback_fn: Callable[[], None]) -> None:
-        """Unregister a callback."""
-        if callback_fn in self._entity_listeners:
-            self._entity_listeners.remove(callback_fn)
-
+    @callback
     def restore_state(self, data: dict[str, Any]) -> None:
         """Restore state from persistent storage."""
         if self._state_restored:
@@ -636,11 +819,13 @@ class AdvancedSwitchController:
             try:
                 self._today_date = date.fromisoformat(data[ATTR_TODAY_DATE])
             except (ValueError, TypeError):
-                self._today_date = date.today()
+                self._today_date = self._today()
 
         # Restore session history
         if data.get(ATTR_SESSION_HISTORY):
-            self._session_history = data[ATTR_SESSION_HISTORY][:SESSION_HISTORY_SIZE]
+            self._session_history.clear()
+            self._session_history.extend(data[ATTR_SESSION_HISTORY][:SESSION_HISTORY_SIZE])
+            self._session_history_cache = None
             self._calculate_averages()
 
         # Restore average values
@@ -652,9 +837,15 @@ class AdvancedSwitchController:
         if data.get(ATTR_SESSION_ACTIVE):
             if data.get(ATTR_SESSION_START_TIME):
                 try:
-                    self._session_start_time = datetime.fromisoformat(
-                        data[ATTR_SESSION_START_TIME]
-                    )
+                    start = datetime.fromisoformat(data[ATTR_SESSION_START_TIME])
+                    if start.tzinfo is None:
+                        # Stored before timestamps were aware (system local time)
+                        start = start.astimezone()
+                    self._session_start_time = dt_util.as_local(start)
+                    # Carry the elapsed wall time over to the monotonic clock
+                    self._session_start_monotonic = self.hass.loop.time() - (
+                        dt_util.now() - self._session_start_time
+                    ).total_seconds()
                 except (ValueError, TypeError):
                     self._session_start_time = None
 
@@ -671,6 +862,7 @@ class AdvancedSwitchController:
             )
 
         self._state_restored = True
+        self._persistence_cache = None
         _LOGGER.debug(
             "Restored state for %s: total=%d, today=%d, energy_today=%.3f",
             self._device_name,
@@ -680,7 +872,17 @@ class AdvancedSwitchController:
         )
 
     def get_persistence_data(self) -> dict[str, Any]:
-        """Get data for persistence."""
+        """Get data for persistence.
+
+        The data is cached until the next entity notification, which is
+        sent whenever anything observable (and so persisted) changed.
+        """
+        if self._persistence_cache is None:
+            self._persistence_cache = self._build_persistence_data()
+        return self._persistence_cache
+
+    def _build_persistence_data(self) -> dict[str, Any]:
+        """Build data for persistence."""
         return {
             ATTR_SESSIONS_TOTAL: self._sessions_total,
             ATTR_SESSIONS_TODAY: self._sessions_today,
@@ -690,13 +892,13 @@ class AdvancedSwitchController:
             ATTR_LAST_SESSION_ENERGY_KWH: self._last_session_energy_kwh,
             ATTR_LAST_SESSION_PEAK_POWER_W: self._last_session_peak_power_w,
             ATTR_TODAY_DATE: self._today_date.isoformat(),
-            ATTR_SESSION_ACTIVE: self._state != STATE_OFF,
+            ATTR_SESSION_ACTIVE: self._state != DeviceState.OFF,
             ATTR_SESSION_START_TIME: (
                 self._session_start_time.isoformat() if self._session_start_time else None
             ),
             ATTR_SESSION_START_ENERGY: self._session_start_energy,
             ATTR_SESSION_PEAK_POWER: self._session_peak_power,
-            ATTR_SESSION_HISTORY: self._session_history,
+            ATTR_SESSION_HISTORY: self.session_history,
             ATTR_AVG_SESSION_DURATION_S: self._avg_session_duration_s,
             ATTR_AVG_SESSION_ENERGY_KWH: self._avg_session_energy_kwh,
         }
@@ -721,115 +923,95 @@ class AdvancedSwitchController:
         if not self._schedule_blocked:
             power_state = self.hass.states.get(self._power_entity)
             if power_state and power_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                try:
-                    power = float(power_state.state)
+                power = self._parse_power(power_state.state)
+                if power is not None:
                     self._current_power = power
                     self._add_power_reading(power)
-                    await self._handle_power_change(power, initial=True)
-                except ValueError:
-                    pass
+                    self._handle_power_change(power, initial=True)
 
         # Check if switch is already on (for auto-off timer)
         switch_state = self.hass.states.get(self._switch_entity)
-        if switch_state and switch_state.state == "on":
+        if switch_state and switch_state.state == STATE_ON:
             self._start_auto_off_timer()
 
-        # Register state change listener
-        @callback
-        def state_listener(event: Event) -> None:
-            """Handle state changes."""
-            entity_id = event.data.get("entity_id")
-            new_state = event.data.get("new_state")
-            self.hass.async_create_task(self._on_state_changed(entity_id, new_state))
+        # Register state change listener (only for our own entities)
+        tracked_entities = [self._power_entity, self._switch_entity]
+        if self._energy_entity:
+            tracked_entities.append(self._energy_entity)
 
         self._remove_listeners.append(
-            self.hass.bus.async_listen(EVENT_STATE_CHANGED, state_listener)
+            async_track_state_change_event(
+                self.hass, tracked_entities, self._state_listener
+            )
         )
 
-        # Register schedule check every minute if schedule is enabled
-        if self._schedule_enabled:
-            @callback
-            def schedule_check(_: datetime) -> None:
-                """Check schedule every minute."""
-                self.hass.async_create_task(self._enforce_schedule())
-
-            self._remove_listeners.append(
-                async_track_time_change(self.hass, schedule_check, second=0)
+        # Reset daily counters at midnight
+        self._remove_listeners.append(
+            async_track_time_change(
+                self.hass, self._daily_reset, hour=0, minute=0, second=0
             )
+        )
+
+        # Re-check the schedule at its start, right after its (inclusive)
+        # end minute, and at midnight when the weekday changes
+        if self._schedule_enabled:
+            end = self._schedule_end.hour * 60 + self._schedule_end.minute + 1
+            boundaries = {
+                (self._schedule_start.hour, self._schedule_start.minute),
+                divmod(end % MINUTES_PER_DAY, 60),
+                (0, 0),
+            }
+            for hour, minute in sorted(boundaries):
+                self._remove_listeners.append(
+                    async_track_time_change(
+                        self.hass,
+                        self._schedule_tick,
+                        hour=hour,
+                        minute=minute,
+                        second=0,
+                    )
+                )
 
         # React to binary sensor state changes for schedule
         if self._schedule_binary_sensor:
-            @callback
-            def binary_sensor_listener(event: Event) -> None:
-                """Re-evaluate schedule when binary sensor changes."""
-                entity_id = event.data.get("entity_id")
-                if entity_id == self._schedule_binary_sensor:
-                    self.hass.async_create_task(self._enforce_schedule())
-
             self._remove_listeners.append(
-                self.hass.bus.async_listen(EVENT_STATE_CHANGED, binary_sensor_listener)
+                async_track_state_change_event(
+                    self.hass,
+                    self._schedule_binary_sensor,
+                    self._schedule_sensor_listener,
+                )
             )
 
         # React to control binary sensor (direct switch mirroring)
         if self._control_binary_sensor:
-            @callback
-            def control_sensor_listener(event: Event) -> None:
-                """Mirror control binary sensor to switch."""
-                entity_id = event.data.get("entity_id")
-                if entity_id == self._control_binary_sensor:
-                    new_state = event.data.get("new_state")
-                    if new_state and new_state.state == "on":
-                        self.hass.async_create_task(self._control_switch_on())
-                    elif new_state and new_state.state == "off":
-                        self.hass.async_create_task(self._control_switch_off())
-
             self._remove_listeners.append(
-                self.hass.bus.async_listen(EVENT_STATE_CHANGED, control_sensor_listener)
+                async_track_state_change_event(
+                    self.hass,
+                    self._control_binary_sensor,
+                    self._control_sensor_listener,
+                )
             )
 
             # Apply initial state of control sensor
             cs_state = self.hass.states.get(self._control_binary_sensor)
-            if cs_state and cs_state.state == "off":
+            if cs_state and cs_state.state == HA_STATE_OFF:
                 # Control sensor is OFF at startup — turn switch off
                 self.hass.async_create_task(self._control_switch_off())
 
         # Register periodic power sampling for smoothing (every 2 seconds)
         # This ensures stable values even when sensor doesn't update frequently
         if self._power_smoothing_s > 0:
-            @callback
-            def power_sampling(_: datetime) -> None:
-                """Sample current power for smoothing buffer."""
-                if self._current_power is not None:
-                    self._add_power_reading(self._current_power)
-                    smoothed = self._calculate_smoothed_power()
-                    self.hass.async_create_task(
-                        self._handle_power_change(smoothed)
-                    )
-
             self._remove_listeners.append(
                 async_track_time_interval(
-                    self.hass, power_sampling, timedelta(seconds=2)
+                    self.hass, self._power_sampling_tick, timedelta(seconds=2)
                 )
             )
 
         # Periodic state re-evaluation every 30s to prevent stuck states
         # and update live session sensors
-        @callback
-        def periodic_recheck(_: datetime) -> None:
-            """Re-evaluate state and update live sensors."""
-            # Re-evaluate state machine with current power
-            if self._state != STATE_OFF and self._current_power is not None:
-                smoothed = self._calculate_smoothed_power()
-                self.hass.async_create_task(
-                    self._handle_power_change(smoothed)
-                )
-            # Always notify to update live duration sensors during active sessions
-            if self._session_start_time is not None:
-                self._notify_entities()
-
         self._remove_listeners.append(
             async_track_time_interval(
-                self.hass, periodic_recheck, timedelta(seconds=30)
+                self.hass, self._periodic_recheck, timedelta(seconds=30)
             )
         )
 
@@ -844,11 +1026,17 @@ class AdvancedSwitchController:
 
     async def async_stop(self) -> None:
         """Stop the controller."""
+        self._power_debouncer.async_cancel()
         self._cancel_on_timer()
         self._cancel_off_timer()
-        self._cancel_standby_end_timer()
         self._cancel_auto_off_timer()
-        self._cancel_standby_auto_off_timer()
+        # Release every armed handle, including on/off handles left running
+        for cancel in self._timers.values():
+            cancel()
+        self._timers.clear()
+        if self._notify_handle is not None:
+            self._notify_handle.cancel()
+            self._notify_handle = None
 
         for remove_listener in self._remove_listeners:
             remove_listener()
@@ -856,7 +1044,67 @@ class AdvancedSwitchController:
 
         _LOGGER.info("Advanced Switches stopped for %s", self._device_name)
 
-    async def _on_state_changed(self, entity_id: str, new_state: Any) -> None:
+    @callback
+    def _state_listener(self, event: Event) -> None:
+        """Handle state changes of the tracked entities."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        # Attribute-only updates carry nothing we use
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+        ):
+            return
+        self._on_state_changed(event.data["entity_id"], new_state)
+
+    @callback
+    def _daily_reset(self, _: datetime) -> None:
+        """Reset daily counters when the day changes."""
+        self._check_day_reset()
+
+    @callback
+    def _schedule_tick(self, now: datetime) -> None:
+        """Check schedule at a schedule boundary."""
+        self.hass.async_create_task(self._enforce_schedule(now))
+
+    @callback
+    def _schedule_sensor_listener(self, event: Event) -> None:
+        """Re-evaluate schedule when binary sensor changes."""
+        self.hass.async_create_task(self._enforce_schedule())
+
+    @callback
+    def _control_sensor_listener(self, event: Event) -> None:
+        """Mirror control binary sensor to switch."""
+        new_state = event.data["new_state"]
+        if new_state and new_state.state == STATE_ON:
+            self.hass.async_create_task(self._control_switch_on())
+        elif new_state and new_state.state == HA_STATE_OFF:
+            self.hass.async_create_task(self._control_switch_off())
+
+    @callback
+    def _power_sampling_tick(self, _: datetime) -> None:
+        """Sample current power for smoothing buffer."""
+        if self._current_power is not None:
+            self._add_power_reading(self._current_power)
+            smoothed = self._calculate_smoothed_power()
+            self._handle_power_change(smoothed)
+
+    @callback
+    def _periodic_recheck(self, _: datetime) -> None:
+        """Re-evaluate state and update live sensors."""
+        # Resync the running sum, so float rounding cannot accumulate
+        self._power_sum = sum(self._power_values)
+        # Re-evaluate state machine with current power
+        if self._state != DeviceState.OFF and self._current_power is not None:
+            smoothed = self._calculate_smoothed_power()
+            self._handle_power_change(smoothed)
+        # Always notify to update live duration sensors during active sessions
+        if self._session_start_time is not None:
+            self._notify_entities(force=True)
+
+    @callback
+    def _on_state_changed(self, entity_id: str, new_state: Any) -> None:
         """Handle state changes from monitored entities."""
         if new_state is None:
             return
@@ -869,126 +1117,189 @@ class AdvancedSwitchController:
             return
 
         if entity_id == self._power_entity:
-            self._power_available = True
-            try:
-                power = float(new_state.state)
-                self._current_power = power
-                # Add to smoothing buffer
-                self._add_power_reading(power)
-                # Track peak power only during ACTIVE state (not STANDBY)
-                if self._state == STATE_ACTIVE and power > self._session_peak_power:
-                    self._session_peak_power = power
-                # Use smoothed power for state machine
-                smoothed = self._calculate_smoothed_power()
-                await self._handle_power_change(smoothed)
-            except ValueError:
-                _LOGGER.debug("Invalid power value: %s", new_state.state)
+            self._handle_power_state(new_state)
 
         elif self._energy_entity and entity_id == self._energy_entity:
-            self._energy_available = True
-            try:
-                self._current_energy = float(new_state.state)
-            except ValueError:
-                _LOGGER.debug("Invalid energy value: %s", new_state.state)
+            self._handle_energy_state(new_state)
 
         elif entity_id == self._switch_entity:
             # Handle auto-off timer based on switch state (UI or physical)
-            _LOGGER.debug(
-                "%s: Switch state changed to '%s', auto_off_enabled=%s",
-                self._device_name,
-                new_state.state,
-                self._auto_off_enabled,
-            )
-            if new_state.state == "on":
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Switch state changed to '%s', auto_off_enabled=%s",
+                    self._device_name,
+                    new_state.state,
+                    self._auto_off_enabled,
+                )
+            if new_state.state == STATE_ON:
                 self._start_auto_off_timer()
             else:
                 self._cancel_auto_off_timer()
 
-    async def _handle_power_change(self, power: float, initial: bool = False) -> None:
+    @callback
+    def _handle_power_state(self, new_state: Any) -> None:
+        """Handle a new state of the power entity."""
+        self._power_available = True
+        power = self._parse_power(new_state.state)
+        if power is None:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Invalid power value: %s", new_state.state)
+            return
+        self._current_power = power
+        # Add to smoothing buffer
+        self._add_power_reading(power)
+        # Track peak power only during ACTIVE state (not STANDBY)
+        if self._state == DeviceState.ACTIVE and power > self._session_peak_power:
+            self._session_peak_power = power
+        # State machine runs (debounced) on the smoothed power
+        self._power_debouncer.async_schedule_call()
+
+    @callback
+    def _handle_energy_state(self, new_state: Any) -> None:
+        """Handle a new state of the energy entity."""
+        self._energy_available = True
+        raw = new_state.state
+        if raw == self._last_energy_raw:
+            return
+        self._last_energy_raw = raw
+        self._pending_energy_raw = raw
+
+    def _get_current_energy(self) -> float | None:
+        """Return the latest valid energy value, parsing a pending state."""
+        raw = self._pending_energy_raw
+        if raw is not None:
+            self._pending_energy_raw = None
+            try:
+                self._current_energy = float(raw)
+            except ValueError:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Invalid energy value: %s", raw)
+        return self._current_energy
+
+    @callback
+    def _process_power(self) -> None:
+        """Run the state machine with the latest smoothed power."""
+        self._handle_power_change(self._calculate_smoothed_power())
+
+    @callback
+    def _handle_power_change(self, power: float, initial: bool = False) -> None:
         """Handle power value changes."""
         # Don't process if blocked by schedule
         if self._schedule_blocked:
             return
 
-        self._check_day_reset()
-
-        if self._mode == MODE_SIMPLE:
-            await self._handle_simple_mode(power, initial)
-        else:
-            await self._handle_standby_mode(power, initial)
+        self._mode_handler(power, initial)
 
-    async def _handle_simple_mode(self, power: float, initial: bool = False) -> None:
+    @callback
+    def _handle_simple_mode(self, power: float, initial: bool = False) -> None:
         """Handle power changes in simple mode (OFF/ACTIVE only)."""
-        if self._state == STATE_OFF:
-            if power >= self._active_threshold_w:
+        state = self._state
+        active = self._active_threshold_w
+
+        # Most common case first: device running above threshold
+        if state == DeviceState.ACTIVE:
+            if power >= active:
+                self._cancel_off_timer()
+            else:
+                self._start_off_timer()
+
+        elif state == DeviceState.OFF:
+            if power >= active:
                 if initial:
-                    self._transition_to(STATE_ACTIVE)
+                    self._transition_to(DeviceState.ACTIVE)
                 else:
-                    self._start_on_timer(STATE_ACTIVE)
+                    self._start_on_timer(DeviceState.ACTIVE)
             else:
                 self._cancel_on_timer()
 
-        elif self._state == STATE_ACTIVE:
-            if power < self._active_threshold_w:
-                self._start_off_timer()
-            else:
-                self._cancel_off_timer()
-
-    async def _handle_standby_mode(self, power: float, initial: bool = False) -> None:
+    @callback
+    def _handle_standby_mode(self, power: float, initial: bool = False) -> None:
         """Handle power changes in standby mode (OFF/STANDBY/ACTIVE)."""
-        if self._state == STATE_OFF:
-            if power >= self._active_threshold_w:
-                if initial:
-                    self._transition_to(STATE_ACTIVE)
-                else:
-                    self._start_on_timer(STATE_ACTIVE)
-            elif power >= self._standby_threshold_w:
-                if initial:
-                    self._transition_to(STATE_STANDBY)
+        zone = bisect_right(self._power_thresholds, power)
+        state = self._state
+        pending_end = self._pending_session_end
+
+        # With no timer pending, re-evaluating the same zone in the same
+        # state only cancels timers that are not running
+        evaluation = (state, zone)
+        if (
+            evaluation == self._last_power_eval
+            and not initial
+            and self._on_timer_deadline is None
+            and self._off_timer_deadline is None
+            and "standby_end" not in self._timers
+        ):
+            return
+        self._last_power_eval = evaluation
+
+        # Most common case first: device running above the active threshold
+        if state == DeviceState.ACTIVE:
+            if zone == _ZONE_ACTIVE:
+                # Power is high - cancel any pending transitions
+                if pending_end:
+                    self._cancel_off_timer()
+                self._cancel_on_timer()  # Cancel pending standby transition
+                self._cancel_standby_end_timer()  # Cancel pending session end
+            elif zone == _ZONE_STANDBY:
+                # Power dropped below active but still above standby
+                if self._session_end_on_standby:
+                    # Waschmaschine mode: Session ends when ACTIVE → STANDBY
+                    # Use a timer to avoid false triggers from brief power drops
+                    self._start_standby_end_timer()
                 else:
-                    self._start_on_timer(STATE_STANDBY)
+                    # Sauna mode: Just transition to STANDBY, keep session
+                    if not pending_end:
+                        self._cancel_off_timer()
+                    self._start_on_timer(DeviceState.STANDBY)
             else:
-                self._cancel_on_timer()
+                # Start grace timer (won't restart if already running)
+                self._start_off_timer(use_grace=True)
+                self._cancel_on_timer()  # Cancel any pending standby transition
 
-        elif self._state == STATE_STANDBY:
-            if power >= self._active_threshold_w:
+        elif state == DeviceState.STANDBY:
+            if zone == _ZONE_ACTIVE:
                 # Real activity resumed - cancel pending off and go to active
                 self._cancel_off_timer()
-                self._transition_to(STATE_ACTIVE)
-            elif power < self._standby_threshold_w:
+                self._transition_to(DeviceState.ACTIVE)
+            elif zone == _ZONE_LOW:
                 # Start grace timer (won't restart if already running)
                 self._start_off_timer(use_grace=True)
-            elif not self._pending_session_end:
+            elif not pending_end:
                 # Only cancel if NOT in pending-off mode
                 # This prevents flickering from resetting the grace timer
                 self._cancel_off_timer()
 
-        elif self._state == STATE_ACTIVE:
-            if power < self._standby_threshold_w:
-                # Start grace timer (won't restart if already running)
-                self._start_off_timer(use_grace=True)
-                self._cancel_on_timer()  # Cancel any pending standby transition
-            elif power < self._active_threshold_w:
-                # Power dropped below active but still above standby
-                if self._session_end_on_standby:
-                    # Waschmaschine mode: Session ends when ACTIVE → STANDBY
-                    # Use a timer to avoid false triggers from brief power drops
-                    self._start_standby_end_timer()
+        elif state == DeviceState.OFF:
+            if zone == _ZONE_ACTIVE:
+                if initial:
+                    self._transition_to(DeviceState.ACTIVE)
                 else:
-                    # Sauna mode: Just transition to STANDBY, keep session
-                    if not self._pending_session_end:
-                        self._cancel_off_timer()
-                    self._start_on_timer(STATE_STANDBY)
+                    self._start_on_timer(DeviceState.ACTIVE)
+            elif zone == _ZONE_STANDBY:
+                if initial:
+                    self._transition_to(DeviceState.STANDBY)
+                else:
+                    self._start_on_timer(DeviceState.STANDBY)
             else:
-                # Power is high - cancel any pending transitions
-                if self._pending_session_end:
-                    self._cancel_off_timer()
-                self._cancel_on_timer()  # Cancel pending standby transition
-                self._cancel_standby_end_timer()  # Cancel pending session end
+                self._cancel_on_timer()
 
-    def _start_on_timer(self, target_state: str, delay: int | None = None) -> None:
+    def _arm_timer(
+        self, name: str, delay: float, action: Callable[[datetime], None]
+    ) -> None:
+        """Arm a named timer, the action must pop its handle when it fires."""
+        self._timers[name] = async_call_later(self.hass, delay, action)
+
+    def _cancel_timer(self, name: str) -> bool:
+        """Cancel a named timer, return True if it was armed."""
+        cancel = self._timers.pop(name, None)
+        if cancel is None:
+            return False
+        cancel()
+        return True
+
+    def _start_on_timer(self, target_state: DeviceState, delay: int | None = None) -> None:
         """Start timer for state transition."""
-        if self._pending_on_timer is not None:
+        if self._on_timer_deadline is not None:
             if self._pending_target_state == target_state:
                 return
             self._cancel_on_timer()
@@ -996,98 +1307,130 @@ class AdvancedSwitchController:
         self._pending_target_state = target_state
         # Use active_standby_delay for ACTIVE↔STANDBY, on_delay for others
         if delay is None:
-            if self._state in (STATE_ACTIVE, STATE_STANDBY) and target_state in (STATE_ACTIVE, STATE_STANDBY):
+            # Both states ACTIVE or STANDBY (i.e. not OFF)
+            if self._state in _ON_STATES and target_state in _ON_STATES:
                 delay = self._active_standby_delay_s
             else:
                 delay = self._on_delay_s
 
-        @callback
-        def on_timer_callback(_: datetime) -> None:
-            """Handle on timer expiration."""
-            self._pending_on_timer = None
-            self._pending_target_state = None
-            self._transition_to(target_state)
+        self._on_timer_deadline = self.hass.loop.time() + delay
+        if "on" in self._timers:
+            if self._on_timer_fires_at <= self._on_timer_deadline:
+                return  # Armed handle re-arms itself for the remaining time
+            self._cancel_timer("on")
+        self._arm_on_timer(delay)
+
+    def _arm_on_timer(self, delay: float) -> None:
+        """Arm the on timer handle."""
+        self._on_timer_fires_at = self.hass.loop.time() + delay
+        self._arm_timer("on", delay, self._on_timer_fired)
+
+    @callback
+    def _on_timer_fired(self, _: datetime) -> None:
+        """Handle on timer expiration."""
+        self._timers.pop("on", None)
+        if self._on_timer_deadline is None:
+            return  # Cancelled while armed
+
+        remaining = self._on_timer_deadline - self.hass.loop.time()
+        if remaining > TIMER_TOLERANCE_S:
+            self._arm_on_timer(remaining)
+            return
 
-        self._pending_on_timer = async_call_later(self.hass, delay, on_timer_callback)
+        target_state = self._pending_target_state
+        self._on_timer_deadline = None
+        self._pending_target_state = None
+        self._last_power_eval = None
+        self._transition_to(target_state)
 
     def _cancel_on_timer(self) -> None:
         """Cancel pending on timer."""
-        if self._pending_on_timer is not None:
-            self._pending_on_timer()
-            self._pending_on_timer = None
+        if self._on_timer_deadline is not None:
+            self._on_timer_deadline = None
             self._pending_target_state = None
+            self._last_power_eval = None
 
     def _start_off_timer(self, use_grace: bool = False) -> None:
         """Start timer for state transition to off."""
-        if self._pending_off_timer is not None:
+        if self._off_timer_deadline is not None:
             return  # Timer already running, don't restart
 
         delay = self._session_end_grace_s if use_grace else self._off_delay_s
         self._pending_session_end = True  # Enter pending-off mode
 
-        @callback
-        def off_timer_callback(_: datetime) -> None:
-            """Handle off timer expiration."""
-            self._pending_off_timer = None
-            self._pending_session_end = False
-            self._end_session()
+        self._off_timer_deadline = self.hass.loop.time() + delay
+        if "off" in self._timers:
+            if self._off_timer_fires_at <= self._off_timer_deadline:
+                return  # Armed handle re-arms itself for the remaining time
+            self._cancel_timer("off")
+        self._arm_off_timer(delay)
+
+    def _arm_off_timer(self, delay: float) -> None:
+        """Arm the off timer handle."""
+        self._off_timer_fires_at = self.hass.loop.time() + delay
+        self._arm_timer("off", delay, self._off_timer_fired)
+
+    @callback
+    def _off_timer_fired(self, _: datetime) -> None:
+        """Handle off timer expiration."""
+        self._timers.pop("off", None)
+        if self._off_timer_deadline is None:
+            return  # Cancelled while armed
+
+        remaining = self._off_timer_deadline - self.hass.loop.time()
+        if remaining > TIMER_TOLERANCE_S:
+            self._arm_off_timer(remaining)
+            return
 
-        self._pending_off_timer = async_call_later(self.hass, delay, off_timer_callback)
+        self._off_timer_deadline = None
+        self._pending_session_end = False
+        self._last_power_eval = None
+        self._end_session()
 
     def _cancel_off_timer(self) -> None:
         """Cancel pending off timer."""
-        if self._pending_off_timer is not None:
-            self._pending_off_timer()
-            self._pending_off_timer = None
+        if self._off_timer_deadline is not None:
+            self._off_timer_deadline = None
             self._pending_session_end = False
+            self._last_power_eval = None
 
     def _start_standby_end_timer(self) -> None:
         """Start timer for session end and transition to STANDBY (Waschmaschine mode)."""
-        if self._pending_standby_end_timer is not None:
+        if "standby_end" in self._timers:
             return  # Timer already running
 
-        delay = self._active_standby_delay_s
-
-        @callback
-        def standby_end_callback(_: datetime) -> None:
-            """Handle standby end timer expiration."""
-            self._pending_standby_end_timer = None
-            self._end_session_keep_standby()
+        self._arm_timer(
+            "standby_end", self._active_standby_delay_s, self._standby_end_timer_fired
+        )
 
-        self._pending_standby_end_timer = async_call_later(self.hass, delay, standby_end_callback)
+    @callback
+    def _standby_end_timer_fired(self, _: datetime) -> None:
+        """Handle standby end timer expiration."""
+        self._timers.pop("standby_end", None)
+        self._last_power_eval = None
+        self._end_session_keep_standby()
 
     def _cancel_standby_end_timer(self) -> None:
         """Cancel pending standby end timer."""
-        if self._pending_standby_end_timer is not None:
-            self._pending_standby_end_timer()
-            self._pending_standby_end_timer = None
+        if self._cancel_timer("standby_end"):
+            self._last_power_eval = None
 
     def _start_auto_off_timer(self) -> None:
         """Start auto-off timer."""
         if not self._auto_off_enabled:
-            _LOGGER.debug("%s: Auto-off not enabled, skipping timer", self._device_name)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: Auto-off not enabled, skipping timer", self._device_name)
             return
-        if self._auto_off_timer is not None:
-            _LOGGER.debug("%s: Auto-off timer already running", self._device_name)
+        if "auto_off" in self._timers:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: Auto-off timer already running", self._device_name)
             return
 
         # Calculate when auto-off will trigger
-        self._auto_off_at = datetime.now() + timedelta(minutes=self._auto_off_minutes)
+        self._auto_off_at = dt_util.now() + timedelta(minutes=self._auto_off_minutes)
 
-        @callback
-        def auto_off_callback(_: datetime) -> None:
-            """Handle auto-off timer expiration."""
-            self._auto_off_timer = None
-            self._auto_off_at = None
-            _LOGGER.info(
-                "%s: Auto-off timer expired after %d minutes, turning off",
-                self._device_name,
-                self._auto_off_minutes,
-            )
-            self.hass.async_create_task(self._auto_turn_off())
-
-        self._auto_off_timer = async_call_later(
-            self.hass, self._auto_off_minutes * 60, auto_off_callback
+        self._arm_timer(
+            "auto_off", self._auto_off_minutes * 60, self._auto_off_timer_fired
         )
         _LOGGER.info(
             "%s: Auto-off timer started for %d minutes (at %s)",
@@ -1097,44 +1440,63 @@ class AdvancedSwitchController:
         )
         self._notify_entities()
 
+    @callback
+    def _auto_off_timer_fired(self, _: datetime) -> None:
+        """Handle auto-off timer expiration."""
+        self._timers.pop("auto_off", None)
+        self._auto_off_at = None
+        _LOGGER.info(
+            "%s: Auto-off timer expired after %d minutes, turning off",
+            self._device_name,
+            self._auto_off_minutes,
+        )
+        self._auto_turn_off()
+
     def _cancel_auto_off_timer(self) -> None:
         """Cancel auto-off timer."""
-        if self._auto_off_timer is not None:
-            self._auto_off_timer()
-            self._auto_off_timer = None
+        if self._cancel_timer("auto_off"):
             self._auto_off_at = None
             self._notify_entities()
 
-    async def _auto_turn_off(self) -> None:
+    @callback
+    def _auto_turn_off(self) -> None:
         """Turn off switch due to auto-off timer."""
-        await self.hass.services.async_call(
-            "switch",
-            "turn_off",
-            {"entity_id": self._switch_entity},
-            blocking=True,
-        )
-        self._end_session()
+        # Run the service call in a task, so the timer callback returns
+        # right away
+        self.hass.async_create_task(self._async_auto_turn_off())
+
+    async def _async_auto_turn_off(self) -> None:
+        """Turn off the switch, then end the session once it is off."""
+        try:
+            await self.hass.services.async_call(
+                "switch",
+                "turn_off",
+                self._switch_service_data,
+                blocking=True,
+            )
+        except HomeAssistantError as err:
+            # Keep the session, the switch may still be on
+            _LOGGER.warning(
+                "%s: Auto-off could not turn off %s: %s",
+                self._device_name,
+                self._switch_entity,
+                err,
+            )
+            return
+        if self._state != DeviceState.OFF:
+            self._end_session()
 
     def _start_standby_auto_off_timer(self) -> None:
         """Start auto-off timer for standby state."""
         if not self._auto_off_standby_enabled:
             return
-        if self._standby_auto_off_timer is not None:
+        if "standby_auto_off" in self._timers:
             return  # Already running
 
-        @callback
-        def standby_auto_off_callback(_: datetime) -> None:
-            """Handle standby auto-off timer expiration."""
-            self._standby_auto_off_timer = None
-            _LOGGER.info(
-                "%s: Standby auto-off timer expired after %d minutes, turning off",
-                self._device_name,
-                self._auto_off_standby_minutes,
-            )
-            self.hass.async_create_task(self._auto_turn_off())
-
-        self._standby_auto_off_timer = async_call_later(
-            self.hass, self._auto_off_standby_minutes * 60, standby_auto_off_callback
+        self._arm_timer(
+            "standby_auto_off",
+            self._auto_off_standby_minutes * 60,
+            self._standby_auto_off_timer_fired,
         )
         _LOGGER.debug(
             "%s: Standby auto-off timer started for %d minutes",
@@ -1142,13 +1504,31 @@ class AdvancedSwitchController:
             self._auto_off_standby_minutes,
         )
 
+    @callback
+    def _standby_auto_off_timer_fired(self, _: datetime) -> None:
+        """Handle standby auto-off timer expiration."""
+        self._timers.pop("standby_auto_off", None)
+        _LOGGER.info(
+            "%s: Standby auto-off timer expired after %d minutes, turning off",
+            self._device_name,
+            self._auto_off_standby_minutes,
+        )
+        self._auto_turn_off()
+
     def _cancel_standby_auto_off_timer(self) -> None:
         """Cancel standby auto-off timer."""
-        if self._standby_auto_off_timer is not None:
-            self._standby_auto_off_timer()
-            self._standby_auto_off_timer = None
+        self._cancel_timer("standby_auto_off")
 
-    def _transition_to(self, new_state: str) -> None:
+    def _set_state(self, new_state: DeviceState) -> None:
+        """Set the device state.
+
+        Forgets the last standby mode evaluation, which is only valid for
+        the state it was made in.
+        """
+        self._state = new_state
+        self._last_power_eval = None
+
+    def _transition_to(self, new_state: DeviceState) -> None:
         """Transition to a new state."""
         old_state = self._state
 
@@ -1157,21 +1537,21 @@ class AdvancedSwitchController:
 
         # Session starts only when entering ACTIVE (not STANDBY)
         # Don't restart if session already running (e.g., ACTIVE → STANDBY → ACTIVE)
-        if new_state == STATE_ACTIVE and self._session_start_time is None:
+        if new_state == DeviceState.ACTIVE and self._session_start_time is None:
             self._start_session()
 
         # Manage standby auto-off timer
-        if new_state == STATE_STANDBY:
+        if new_state == DeviceState.STANDBY:
             self._start_standby_auto_off_timer()
         else:
             self._cancel_standby_auto_off_timer()
 
-        self._state = new_state
+        self._set_state(new_state)
         _LOGGER.info(
             "%s: State transition %s -> %s (power=%.2f, smoothing=%ds)",
             self._device_name,
-            old_state,
-            new_state,
+            DEVICE_STATE_NAMES[old_state],
+            DEVICE_STATE_NAMES[new_state],
             self._current_power,
             self._power_smoothing_s,
         )
@@ -1179,27 +1559,28 @@ class AdvancedSwitchController:
 
     def _start_session(self) -> None:
         """Start a new session."""
-        self._session_start_time = datetime.now()
-        self._session_start_energy = self._current_energy
+        self._session_start_time = dt_util.now()
+        self._session_start_monotonic = self.hass.loop.time()
+        self._session_start_energy = self._get_current_energy()
         self._session_peak_power = self._current_power
-        _LOGGER.debug(
-            "%s: Session started at %s with energy %.3f kWh",
-            self._device_name,
-            self._session_start_time,
-            self._session_start_energy or 0,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Session started at %s with energy %.3f kWh",
+                self._device_name,
+                self._session_start_time,
+                self._session_start_energy or 0,
+            )
 
     def _end_session(self) -> None:
         """End the current session."""
         self._cancel_auto_off_timer()
 
         if self._session_start_time is None:
-            self._state = STATE_OFF
+            self._set_state(DeviceState.OFF)
             self._notify_entities()
             return
 
-        now = datetime.now()
-        duration_s = (now - self._session_start_time).total_seconds()
+        duration_s = self.hass.loop.time() - self._session_start_monotonic
 
         if duration_s < self._min_duration_s:
             _LOGGER.debug(
@@ -1211,8 +1592,23 @@ class AdvancedSwitchController:
             self._reset_session()
             return
 
-        if self._current_energy is not None and self._session_start_energy is not None:
-            energy_kwh = max(0.0, self._current_energy - self._session_start_energy)
+        self._record_session(duration_s)
+
+        _LOGGER.info(
+            "%s: Session ended - duration: %ds, energy: %.3f kWh, peak: %.1f W",
+            self._device_name,
+            self._last_session_duration_s,
+            self._last_session_energy_kwh,
+            self._last_session_peak_power_w,
+        )
+
+        self._reset_session()
+
+    def _record_session(self, duration_s: float) -> None:
+        """Count the finished session and add it to the history."""
+        current_energy = self._get_current_energy()
+        if current_energy is not None and self._session_start_energy is not None:
+            energy_kwh = max(0.0, current_energy - self._session_start_energy)
         else:
             energy_kwh = 0.0
             _LOGGER.debug("%s: Energy sensor unavailable, session energy set to 0", self._device_name)
@@ -1221,59 +1617,66 @@ class AdvancedSwitchController:
         self._sessions_today += 1
         self._energy_today_kwh += energy_kwh
         self._energy_total_kwh += energy_kwh
-        self._last_session_duration_s = int(duration_s)
-        self._last_session_energy_kwh = round(energy_kwh, 3)
-        self._last_session_peak_power_w = round(self._session_peak_power, 1)
-
-        # Add to session history
-        session_record = {
-            "start": self._session_start_time.isoformat(),
-            "end": now.isoformat(),
-            "duration_s": self._last_session_duration_s,
-            "energy_kwh": self._last_session_energy_kwh,
-            "peak_power_w": self._last_session_peak_power_w,
-        }
-        self._session_history.insert(0, session_record)
-        # Keep only last N sessions
-        self._session_history = self._session_history[:SESSION_HISTORY_SIZE]
-
-        # Recalculate averages
-        self._calculate_averages()
 
-        _LOGGER.info(
-            "%s: Session ended - duration: %ds, energy: %.3f kWh, peak: %.1f W",
-            self._device_name,
-            self._last_session_duration_s,
-            self._last_session_energy_kwh,
-            self._last_session_peak_power_w,
+        # Round once, shared by the last-session values and the history
+        duration = int(duration_s)
+        energy = round(energy_kwh, 3)
+        peak_power = round(self._session_peak_power, 1)
+        self._last_session_duration_s = duration
+        self._last_session_energy_kwh = energy
+        self._last_session_peak_power_w = peak_power
+
+        self._add_session_to_history(
+            {
+                "start": self._session_start_time,
+                "end": dt_util.now(),
+                "duration_s": duration,
+                "energy_kwh": energy,
+                "peak_power_w": peak_power,
+            }
         )
 
-        self._reset_session()
+    def _add_session_to_history(self, session_record: dict[str, Any]) -> None:
+        """Add a session to the history and update the averages."""
+        history = self._session_history
+        if len(history) == history.maxlen:
+            # Oldest session is about to be evicted
+            evicted = history[-1]
+            self._history_duration_sum -= evicted.get("duration_s", 0)
+            self._history_energy_sum -= evicted.get("energy_kwh", 0)
+
+        history.appendleft(session_record)
+        self._session_history_cache = None
+        self._history_duration_sum += session_record["duration_s"]
+        self._history_energy_sum += session_record["energy_kwh"]
+        self._update_averages()
 
     def _calculate_averages(self) -> None:
-        """Calculate average session values from history."""
+        """Recalculate history sums and averages from the full history."""
+        self._history_duration_sum = sum(s.get("duration_s", 0) for s in self._session_history)
+        self._history_energy_sum = sum(s.get("energy_kwh", 0) for s in self._session_history)
+        self._update_averages()
+
+    def _update_averages(self) -> None:
+        """Calculate average session values from the history sums."""
         if not self._session_history:
             self._avg_session_duration_s = None
             self._avg_session_energy_kwh = None
             return
 
-        total_duration = sum(s.get("duration_s", 0) for s in self._session_history)
-        total_energy = sum(s.get("energy_kwh", 0) for s in self._session_history)
         count = len(self._session_history)
-
-        self._avg_session_duration_s = round(total_duration / count, 1)
-        self._avg_session_energy_kwh = round(total_energy / count, 3)
+        self._avg_session_duration_s = round(self._history_duration_sum / count, 1)
+        self._avg_session_energy_kwh = round(self._history_energy_sum / count, 3)
 
     def _end_session_keep_standby(self) -> None:
         """End the current session but transition to STANDBY (for Waschmaschine mode)."""
         if self._session_start_time is None:
             # No session running, just go to standby
-            self._state = STATE_STANDBY
+            self._set_state(DeviceState.STANDBY)
             self._notify_entities()
             return
 
-        now = datetime.now()
-        duration_s = (now - self._session_start_time).total_seconds()
+        duration_s = self.hass.loop.time() - self._session_start_monotonic
 
         if duration_s < self._min_duration_s:
             _LOGGER.debug(
@@ -1285,35 +1688,12 @@ class AdvancedSwitchController:
             self._session_start_time = None
             self._session_start_energy = None
             self._session_peak_power = 0.0
-            self._state = STATE_STANDBY
+            self._set_state(DeviceState.STANDBY)
             self._notify_entities()
             return
 
         # Calculate and save session stats
-        if self._current_energy is not None and self._session_start_energy is not None:
-            energy_kwh = max(0.0, self._current_energy - self._session_start_energy)
-        else:
-            energy_kwh = 0.0
-
-        self._sessions_total += 1
-        self._sessions_today += 1
-        self._energy_today_kwh += energy_kwh
-        self._energy_total_kwh += energy_kwh
-        self._last_session_duration_s = int(duration_s)
-        self._last_session_energy_kwh = round(energy_kwh, 3)
-        self._last_session_peak_power_w = round(self._session_peak_power, 1)
-
-        # Add to session history
-        session_record = {
-            "start": self._session_start_time.isoformat(),
-            "end": now.isoformat(),
-            "duration_s": self._last_session_duration_s,
-            "energy_kwh": self._last_session_energy_kwh,
-            "peak_power_w": self._last_session_peak_power_w,
-        }
-        self._session_history.insert(0, session_record)
-        self._session_history = self._session_history[:SESSION_HISTORY_SIZE]
-        self._calculate_averages()
+        self._record_session(duration_s)
 
         _LOGGER.info(
             "%s: Session ended (going to standby) - duration: %ds, energy: %.3f kWh",
@@ -1327,7 +1707,7 @@ class AdvancedSwitchController:
         self._session_start_energy = None
         self._session_peak_power = 0.0
         self._pending_session_end = False
-        self._state = STATE_STANDBY
+        self._set_state(DeviceState.STANDBY)
         self._notify_entities()
 
     def _reset_session(self) -> None:
@@ -1336,12 +1716,13 @@ class AdvancedSwitchController:
         self._session_start_energy = None
         self._session_peak_power = 0.0
         self._pending_session_end = False
-        self._state = STATE_OFF
+        self._set_state(DeviceState.OFF)
         self._notify_entities()
 
+    @callback
     def _check_day_reset(self) -> None:
         """Check if we need to reset daily counters."""
-        today = date.today()
+        today = self._today()
         if self._today_date != today:
             _LOGGER.debug(
                 "%s: Day changed, resetting daily counters",
@@ -1352,6 +1733,7 @@ class AdvancedSwitchController:
             self._today_date = today
             self._notify_entities()
 
+    @callback
     def reset_all_counters(self) -> None:
         """Reset all session counters to zero."""
         _LOGGER.info("%s: Resetting all counters", self._device_name)
@@ -1363,19 +1745,24 @@ class AdvancedSwitchController:
         self._last_session_energy_kwh = None
         self._last_session_peak_power_w = None
         self._session_history.clear()
+        self._session_history_cache = None
+        self._history_duration_sum = 0.0
+        self._history_energy_sum = 0.0
         self._avg_session_duration_s = None
         self._avg_session_energy_kwh = None
-        self._today_date = date.today()
+        self._today_date = self._today()
         self._notify_entities()
 
+    @callback
     def reset_today_counters(self) -> None:
         """Reset only today's counters."""
         _LOGGER.info("%s: Resetting today's counters", self._device_name)
         self._sessions_today = 0
         self._energy_today_kwh = 0.0
-        self._today_date = date.today()
+        self._today_date = self._today()
         self._notify_entities()
 
+    @callback
     def reset_total_counters(self) -> None:
         """Reset total counters (sessions_total, energy_total)."""
         _LOGGER.info("%s: Resetting total counters", self._device_name)
@@ -1383,6 +1770,7 @@ class AdvancedSwitchController:
         self._energy_total_kwh = 0.0
         self._notify_entities()
 
+    @callback
     def reset_last_session(self) -> None:
         """Reset last session data."""
         _LOGGER.info("%s: Resetting last session data", self._device_name)
@@ -1391,22 +1779,97 @@ class AdvancedSwitchController:
         self._last_session_peak_power_w = None
         self._notify_entities()
 
+    @callback
     def reset_session_history(self) -> None:
         """Reset session history and averages."""
         _LOGGER.info("%s: Resetting session history", self._device_name)
         self._session_history.clear()
+        self._session_history_cache = None
+        self._history_duration_sum = 0.0
+        self._history_energy_sum = 0.0
         self._avg_session_duration_s = None
         self._avg_session_energy_kwh = None
         self._notify_entities()
 
-    def _notify_entities(self) -> None:
-        """Notify all registered entities of updates."""
-        for callback_fn in self._entity_listeners:
-            try:
-                callback_fn()
-            except Exception:  # noqa: BLE001
-                _LOGGER.exception("Error notifying entity listener")
+    def _rounded_session_energy(self) -> float | None:
+        """Return the live session energy at the precision it is shown."""
+        energy = self.current_session_energy_kwh
+        return round(energy, 3) if energy is not None else None
 
-    async def async_can_turn_on(self) -> bool:
+    def _observable_key(self) -> tuple:
+        """Return a snapshot of the values exposed by the entities.
+
+        The first two values cover everything the binary sensors expose.
+        """
+        return (
+            self.state,
+            self._was_on_before_schedule_off,
+            self._pending_session_end,
+            round(self._current_power, 1),
+            round(self.smoothed_power, 2),
+            self._session_start_time,
+            self._session_peak_power,
+            self._rounded_session_energy(),
+            self._sessions_total,
+            self._sessions_today,
+            self._today_date,
+            self._energy_today_kwh,
+            self._energy_total_kwh,
+            self._last_session_duration_s,
+            self._last_session_energy_kwh,
+            self._last_session_peak_power_w,
+            len(self._session_history),
+            self._avg_session_duration_s,
+            self._avg_session_energy_kwh,
+            self._auto_off_at,
+        )
+
+    @callback
+    def _notify_entities(self, force: bool = False) -> None:
+        """Notify all registered entities of updates.
+
+        Notifications requested within NOTIFY_COALESCE_S are coalesced
+        into a single one, sent by _flush_notify. Must be called
+        from the event loop; entities handle the signal with a sync
+        callback writing their state via async_write_ha_state.
+        """
+        if force:
+            self._notify_forced = True
+        if self._notify_handle is not None:
+            return
+        self._notify_handle = self.hass.loop.call_later(
+            NOTIFY_COALESCE_S, self._flush_notify
+        )
+
+    @callback
+    def _flush_notify(self) -> None:
+        """Send the pending entity notification.
+
+        Skipped if nothing observable changed since the last notification,
+        unless forced (e.g. to refresh the live session sensors).
+        """
+        force = self._notify_forced
+        self._notify_handle = None
+        self._notify_forced = False
+
+        key = self._observable_key()
+        last_key = self._last_notify_key
+        if not force and key == last_key:
+            return
+        self._last_notify_key = key
+        self._persistence_cache = None
+        if last_key is None or key[:2] != last_key[:2]:
+            async_dispatcher_send(self.hass, self._state_signal)
+        async_dispatcher_send(self.hass, self._update_signal)
+
+    @callback
+    def can_turn_on(self) -> bool:
         """Check if the switch can be turned on (respects schedule)."""
         return not self._schedule_blocked
+
+    async def async_can_turn_on(self) -> bool:
+        """Check if the switch can be turned on (respects schedule).
+
+        Deprecated alias of can_turn_on, kept for existing callers.
+        """
+        return self.can_turn_on()
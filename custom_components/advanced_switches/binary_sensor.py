@@ -10,12 +10,11 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AdvancedSwitchController
 from .const import (
-    CONF_DEVICE_NAME,
     DOMAIN,
     MODE_STANDBY,
     STATE_ACTIVE,
@@ -24,6 +23,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Controller states in which the device counts as on
+_ON_STATES: frozenset[str] = frozenset((STATE_STANDBY, STATE_ACTIVE))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -52,6 +54,8 @@ class BaseBinarySensor(BinarySensorEntity):
 
     _attr_should_poll = False
     _attr_has_entity_name = True
+    _unique_id_suffix: str  # Appended to the entry ID
+    _last_is_on: bool | None = None  # Value of the last state write
 
     def __init__(
         self,
@@ -61,34 +65,25 @@ class BaseBinarySensor(BinarySensorEntity):
         """Initialize the binary sensor."""
         self._ctrl = controller
         self._entry = entry
-
-        # Link to source device if available, otherwise create virtual device
-        source_identifiers = controller.get_source_device_identifiers()
-        if source_identifiers:
-            self._attr_device_info = DeviceInfo(
-                identifiers=source_identifiers,
-            )
-        else:
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, entry.entry_id)},
-                name=entry.data[CONF_DEVICE_NAME],
-                manufacturer="Advanced Switches",
-                model="Virtual Device",
-            )
+        self._attr_unique_id = entry.entry_id + self._unique_id_suffix
+        self._attr_device_info = controller.device_info
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
         await super().async_added_to_hass()
-        self._ctrl.register_entity_listener(self._on_controller_update)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unregister callbacks when entity is removed."""
-        self._ctrl.unregister_entity_listener(self._on_controller_update)
-        await super().async_will_remove_from_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._ctrl.state_signal, self._on_controller_update
+            )
+        )
 
     @callback
     def _on_controller_update(self) -> None:
         """Handle controller updates."""
+        is_on = self.is_on
+        if is_on == self._last_is_on:
+            return
+        self._last_is_on = is_on
         self.async_write_ha_state()
 
 
@@ -98,15 +93,7 @@ class ActiveBinarySensor(BaseBinarySensor):
     _attr_translation_key = "active"
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_active"
+    _unique_id_suffix = "_active"
 
     @property
     def is_on(self) -> bool:
@@ -120,20 +107,12 @@ class OnBinarySensor(BaseBinarySensor):
     _attr_translation_key = "on"
     _attr_device_class = BinarySensorDeviceClass.POWER
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_on"
+    _unique_id_suffix = "_on"
 
     @property
     def is_on(self) -> bool:
         """Return true if device is in standby or active state."""
-        return self._ctrl.state in (STATE_STANDBY, STATE_ACTIVE)
+        return self._ctrl.state in _ON_STATES
 
 
 class ScheduleBlockedSensor(BaseBinarySensor):
@@ -142,15 +121,7 @@ class ScheduleBlockedSensor(BaseBinarySensor):
     _attr_translation_key = "schedule_blocked"
     _attr_device_class = BinarySensorDeviceClass.LOCK
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_schedule_blocked"
+    _unique_id_suffix = "_schedule_blocked"
 
     @property
     def is_on(self) -> bool:
@@ -164,15 +135,7 @@ class ScheduleTurnedOffSensor(BaseBinarySensor):
     _attr_translation_key = "schedule_turned_off"
     _attr_device_class = BinarySensorDeviceClass.POWER
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_schedule_turned_off"
+    _unique_id_suffix = "_schedule_turned_off"
 
     @property
     def is_on(self) -> bool:
@@ -62,15 +62,208 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-WEEKDAYS = [
-    {"value": "0", "label": "Monday"},
-    {"value": "1", "label": "Tuesday"},
-    {"value": "2", "label": "Wednesday"},
-    {"value": "3", "label": "Thursday"},
-    {"value": "4", "label": "Friday"},
-    {"value": "5", "label": "Saturday"},
-    {"value": "6", "label": "Sunday"},
-]
+# Weekday labels, indexed by the day value (Mon=0, Sun=6)
+WEEKDAY_LABELS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+# Selectors shared by the config and options flow steps
+_ACTIVE_THRESHOLD_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=10000,
+        step=1,
+        unit_of_measurement="W",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_STANDBY_THRESHOLD_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.1,
+        max=1000,
+        step=0.1,
+        unit_of_measurement="W",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_DELAY_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=300,
+        step=1,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_DURATION_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=600,
+        step=1,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_MINUTES_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=1440,
+        step=1,
+        unit_of_measurement="min",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_TIME_SELECTOR = selector.TimeSelector()
+_BINARY_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="binary_sensor")
+)
+_WEEKDAYS_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value=str(day), label=label)
+            for day, label in enumerate(WEEKDAY_LABELS)
+        ],
+        multiple=True,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+# Default schedule days as selected in the weekday selector
+_DEFAULT_SCHEDULE_DAYS = [str(d) for d in DEFAULT_SCHEDULE_DAYS]
+
+# Schemas of the steps without entry-specific defaults
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_NAME): str,
+        vol.Required(CONF_SWITCH_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="switch")
+        ),
+        vol.Required(CONF_POWER_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="sensor",
+                device_class="power",
+            )
+        ),
+        vol.Optional(CONF_ENERGY_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="sensor",
+                device_class="energy",
+            )
+        ),
+        vol.Required(CONF_MODE, default=MODE_SIMPLE): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    selector.SelectOptionDict(
+                        value=MODE_SIMPLE,
+                        label="Simple (OFF/ACTIVE)",
+                    ),
+                    selector.SelectOptionDict(
+                        value=MODE_STANDBY,
+                        label="Standby (OFF/STANDBY/ACTIVE)",
+                    ),
+                ],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+    }
+)
+_SIMPLE_PARAMS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_ACTIVE_THRESHOLD_W,
+            default=DEFAULT_ACTIVE_THRESHOLD_W,
+        ): _ACTIVE_THRESHOLD_SELECTOR,
+        vol.Required(
+            CONF_ON_DELAY_S,
+            default=DEFAULT_ON_DELAY_S,
+        ): _DELAY_SELECTOR,
+        vol.Required(
+            CONF_OFF_DELAY_S,
+            default=DEFAULT_OFF_DELAY_S,
+        ): _DELAY_SELECTOR,
+        vol.Required(
+            CONF_MIN_ACTIVE_S,
+            default=DEFAULT_MIN_ACTIVE_S,
+        ): _DURATION_SELECTOR,
+        vol.Required(
+            CONF_POWER_SMOOTHING_S,
+            default=DEFAULT_POWER_SMOOTHING_S,
+        ): _DELAY_SELECTOR,
+    }
+)
+_STANDBY_PARAMS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_STANDBY_THRESHOLD_W,
+            default=DEFAULT_STANDBY_THRESHOLD_W,
+        ): _STANDBY_THRESHOLD_SELECTOR,
+        vol.Required(
+            CONF_ACTIVE_THRESHOLD_W,
+            default=DEFAULT_ACTIVE_THRESHOLD_W_STANDBY,
+        ): _ACTIVE_THRESHOLD_SELECTOR,
+        vol.Required(
+            CONF_ON_DELAY_S,
+            default=DEFAULT_ON_DELAY_S,
+        ): _DELAY_SELECTOR,
+        vol.Required(
+            CONF_ACTIVE_STANDBY_DELAY_S,
+            default=DEFAULT_ACTIVE_STANDBY_DELAY_S,
+        ): _DELAY_SELECTOR,
+        vol.Required(
+            CONF_SESSION_END_GRACE_S,
+            default=DEFAULT_SESSION_END_GRACE_S,
+        ): _DURATION_SELECTOR,
+        vol.Required(
+            CONF_MIN_SESSION_S,
+            default=DEFAULT_MIN_SESSION_S,
+        ): _DURATION_SELECTOR,
+        vol.Required(
+            CONF_POWER_SMOOTHING_S,
+            default=DEFAULT_POWER_SMOOTHING_S,
+        ): _DELAY_SELECTOR,
+        vol.Required(
+            CONF_SESSION_END_ON_STANDBY,
+            default=DEFAULT_SESSION_END_ON_STANDBY,
+        ): _BOOLEAN_SELECTOR,
+    }
+)
+_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_SCHEDULE_ENABLED,
+            default=DEFAULT_SCHEDULE_ENABLED,
+        ): _BOOLEAN_SELECTOR,
+        vol.Required(
+            CONF_SCHEDULE_START,
+            default=DEFAULT_SCHEDULE_START,
+        ): _TIME_SELECTOR,
+        vol.Required(
+            CONF_SCHEDULE_END,
+            default=DEFAULT_SCHEDULE_END,
+        ): _TIME_SELECTOR,
+        vol.Required(
+            CONF_SCHEDULE_DAYS,
+            default=_DEFAULT_SCHEDULE_DAYS,
+        ): _WEEKDAYS_SELECTOR,
+        vol.Optional(CONF_SCHEDULE_BINARY_SENSOR): _BINARY_SENSOR_SELECTOR,
+        vol.Optional(CONF_CONTROL_BINARY_SENSOR): _BINARY_SENSOR_SELECTOR,
+    }
+)
+_RESET_SCHEMA = vol.Schema(
+    {
+        vol.Optional("reset_all", default=False): _BOOLEAN_SELECTOR,
+        vol.Optional("reset_today", default=False): _BOOLEAN_SELECTOR,
+        vol.Optional("reset_total", default=False): _BOOLEAN_SELECTOR,
+        vol.Optional("reset_last_session", default=False): _BOOLEAN_SELECTOR,
+        vol.Optional("reset_history", default=False): _BOOLEAN_SELECTOR,
+    }
+)
 
 
 class AdvancedSwitchesConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -109,41 +302,7 @@ class AdvancedSwitchesConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_DEVICE_NAME): str,
-                    vol.Required(CONF_SWITCH_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="switch")
-                    ),
-                    vol.Required(CONF_POWER_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="sensor",
-                            device_class="power",
-                        )
-                    ),
-                    vol.Optional(CONF_ENERGY_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="sensor",
-                            device_class="energy",
-                        )
-                    ),
-                    vol.Required(CONF_MODE, default=MODE_SIMPLE): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(
-                                    value=MODE_SIMPLE,
-                                    label="Simple (OFF/ACTIVE)",
-                                ),
-                                selector.SelectOptionDict(
-                                    value=MODE_STANDBY,
-                                    label="Standby (OFF/STANDBY/ACTIVE)",
-                                ),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -157,70 +316,7 @@ class AdvancedSwitchesConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="simple_params",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_ACTIVE_THRESHOLD_W,
-                        default=DEFAULT_ACTIVE_THRESHOLD_W,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=10000,
-                            step=1,
-                            unit_of_measurement="W",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_ON_DELAY_S,
-                        default=DEFAULT_ON_DELAY_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_OFF_DELAY_S,
-                        default=DEFAULT_OFF_DELAY_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_MIN_ACTIVE_S,
-                        default=DEFAULT_MIN_ACTIVE_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=600,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_POWER_SMOOTHING_S,
-                        default=DEFAULT_POWER_SMOOTHING_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                }
-            ),
+            data_schema=_SIMPLE_PARAMS_SCHEMA,
         )
 
     async def async_step_standby_params(
@@ -233,98 +329,7 @@ class AdvancedSwitchesConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="standby_params",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_STANDBY_THRESHOLD_W,
-                        default=DEFAULT_STANDBY_THRESHOLD_W,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0.1,
-                            max=1000,
-                            step=0.1,
-                            unit_of_measurement="W",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_ACTIVE_THRESHOLD_W,
-                        default=DEFAULT_ACTIVE_THRESHOLD_W_STANDBY,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=10000,
-                            step=1,
-                            unit_of_measurement="W",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_ON_DELAY_S,
-                        default=DEFAULT_ON_DELAY_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_ACTIVE_STANDBY_DELAY_S,
-                        default=DEFAULT_ACTIVE_STANDBY_DELAY_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_SESSION_END_GRACE_S,
-                        default=DEFAULT_SESSION_END_GRACE_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=600,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_MIN_SESSION_S,
-                        default=DEFAULT_MIN_SESSION_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=600,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_POWER_SMOOTHING_S,
-                        default=DEFAULT_POWER_SMOOTHING_S,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_SESSION_END_ON_STANDBY,
-                        default=DEFAULT_SESSION_END_ON_STANDBY,
-                    ): selector.BooleanSelector(),
-                }
-            ),
+            data_schema=_STANDBY_PARAMS_SCHEMA,
         )
 
     async def async_step_schedule(
@@ -334,49 +339,15 @@ class AdvancedSwitchesConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Convert day strings back to integers
             if CONF_SCHEDULE_DAYS in user_input:
-                user_input[CONF_SCHEDULE_DAYS] = [
-                    int(d) for d in user_input[CONF_SCHEDULE_DAYS]
-                ]
+                user_input[CONF_SCHEDULE_DAYS] = list(
+                    map(int, user_input[CONF_SCHEDULE_DAYS])
+                )
             self._data.update(user_input)
             return self._create_entry()
 
         return self.async_show_form(
             step_id="schedule",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SCHEDULE_ENABLED,
-                        default=DEFAULT_SCHEDULE_ENABLED,
-                    ): selector.BooleanSelector(),
-                    vol.Required(
-                        CONF_SCHEDULE_START,
-                        default=DEFAULT_SCHEDULE_START,
-                    ): selector.TimeSelector(),
-                    vol.Required(
-                        CONF_SCHEDULE_END,
-                        default=DEFAULT_SCHEDULE_END,
-                    ): selector.TimeSelector(),
-                    vol.Required(
-                        CONF_SCHEDULE_DAYS,
-                        default=[str(d) for d in DEFAULT_SCHEDULE_DAYS],
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(value=d["value"], label=d["label"])
-                                for d in WEEKDAYS
-                            ],
-                            multiple=True,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Optional(CONF_SCHEDULE_BINARY_SENSOR): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="binary_sensor")
-                    ),
-                    vol.Optional(CONF_CONTROL_BINARY_SENSOR): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="binary_sensor")
-                    ),
-                }
-            ),
+            data_schema=_SCHEDULE_SCHEMA,
         )
 
     def _create_entry(self) -> ConfigFlowResult:
@@ -425,15 +396,7 @@ class AdvancedSwitchesOptionsFlow(OptionsFlow):
                         vol.Required(
                             CONF_ACTIVE_THRESHOLD_W,
                             default=current.get(CONF_ACTIVE_THRESHOLD_W, DEFAULT_ACTIVE_THRESHOLD_W),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=1,
-                                max=10000,
-                                step=1,
-                                unit_of_measurement="W",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _ACTIVE_THRESHOLD_SELECTOR,
                     }
                 ),
             )
@@ -445,27 +408,11 @@ class AdvancedSwitchesOptionsFlow(OptionsFlow):
                         vol.Required(
                             CONF_STANDBY_THRESHOLD_W,
                             default=current.get(CONF_STANDBY_THRESHOLD_W, DEFAULT_STANDBY_THRESHOLD_W),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0.1,
-                                max=1000,
-                                step=0.1,
-                                unit_of_measurement="W",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _STANDBY_THRESHOLD_SELECTOR,
                         vol.Required(
                             CONF_ACTIVE_THRESHOLD_W,
                             default=current.get(CONF_ACTIVE_THRESHOLD_W, DEFAULT_ACTIVE_THRESHOLD_W_STANDBY),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=1,
-                                max=10000,
-                                step=1,
-                                unit_of_measurement="W",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _ACTIVE_THRESHOLD_SELECTOR,
                     }
                 ),
             )
@@ -492,51 +439,19 @@ class AdvancedSwitchesOptionsFlow(OptionsFlow):
                         vol.Required(
                             CONF_ON_DELAY_S,
                             default=current.get(CONF_ON_DELAY_S, DEFAULT_ON_DELAY_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=300,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DELAY_SELECTOR,
                         vol.Required(
                             CONF_OFF_DELAY_S,
                             default=current.get(CONF_OFF_DELAY_S, DEFAULT_OFF_DELAY_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=300,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DELAY_SELECTOR,
                         vol.Required(
                             CONF_MIN_ACTIVE_S,
                             default=current.get(CONF_MIN_ACTIVE_S, DEFAULT_MIN_ACTIVE_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=600,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DURATION_SELECTOR,
                         vol.Required(
                             CONF_POWER_SMOOTHING_S,
                             default=current.get(CONF_POWER_SMOOTHING_S, DEFAULT_POWER_SMOOTHING_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=300,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DELAY_SELECTOR,
                     }
                 ),
             )
@@ -548,67 +463,27 @@ class AdvancedSwitchesOptionsFlow(OptionsFlow):
                         vol.Required(
                             CONF_ON_DELAY_S,
                             default=current.get(CONF_ON_DELAY_S, DEFAULT_ON_DELAY_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=300,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DELAY_SELECTOR,
                         vol.Required(
                             CONF_ACTIVE_STANDBY_DELAY_S,
                             default=current.get(CONF_ACTIVE_STANDBY_DELAY_S, DEFAULT_ACTIVE_STANDBY_DELAY_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=300,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DELAY_SELECTOR,
                         vol.Required(
                             CONF_SESSION_END_GRACE_S,
                             default=current.get(CONF_SESSION_END_GRACE_S, DEFAULT_SESSION_END_GRACE_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=600,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DURATION_SELECTOR,
                         vol.Required(
                             CONF_MIN_SESSION_S,
                             default=current.get(CONF_MIN_SESSION_S, DEFAULT_MIN_SESSION_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=600,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DURATION_SELECTOR,
                         vol.Required(
                             CONF_POWER_SMOOTHING_S,
                             default=current.get(CONF_POWER_SMOOTHING_S, DEFAULT_POWER_SMOOTHING_S),
-                        ): selector.NumberSelector(
-                            selector.NumberSelectorConfig(
-                                min=0,
-                                max=300,
-                                step=1,
-                                unit_of_measurement="s",
-                                mode=selector.NumberSelectorMode.BOX,
-                            )
-                        ),
+                        ): _DELAY_SELECTOR,
                         vol.Required(
                             CONF_SESSION_END_ON_STANDBY,
                             default=current.get(CONF_SESSION_END_ON_STANDBY, DEFAULT_SESSION_END_ON_STANDBY),
-                        ): selector.BooleanSelector(),
+                        ): _BOOLEAN_SELECTOR,
                     }
                 ),
             )
@@ -620,9 +495,9 @@ class AdvancedSwitchesOptionsFlow(OptionsFlow):
         if user_input is not None:
             # Convert day strings back to integers
             if CONF_SCHEDULE_DAYS in user_input:
-                user_input[CONF_SCHEDULE_DAYS] = [
-                    int(d) for d in user_input[CONF_SCHEDULE_DAYS]
-                ]
+                user_input[CONF_SCHEDULE_DAYS] = list(
+                    map(int, user_input[CONF_SCHEDULE_DAYS])
+                )
             # Handle removed binary sensors
             if CONF_SCHEDULE_BINARY_SENSOR not in user_input:
                 user_input[CONF_SCHEDULE_BINARY_SENSOR] = ""
@@ -642,35 +517,26 @@ class AdvancedSwitchesOptionsFlow(OptionsFlow):
             vol.Required(
                 CONF_SCHEDULE_ENABLED,
                 default=current.get(CONF_SCHEDULE_ENABLED, DEFAULT_SCHEDULE_ENABLED),
-            ): selector.BooleanSelector(),
+            ): _BOOLEAN_SELECTOR,
             vol.Required(
                 CONF_SCHEDULE_START,
                 default=current.get(CONF_SCHEDULE_START, DEFAULT_SCHEDULE_START),
-            ): selector.TimeSelector(),
+            ): _TIME_SELECTOR,
             vol.Required(
                 CONF_SCHEDULE_END,
                 default=current.get(CONF_SCHEDULE_END, DEFAULT_SCHEDULE_END),
-            ): selector.TimeSelector(),
+            ): _TIME_SELECTOR,
             vol.Required(
                 CONF_SCHEDULE_DAYS,
                 default=[str(d) for d in current_days],
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        selector.SelectOptionDict(value=d["value"], label=d["label"])
-                        for d in WEEKDAYS
-                    ],
-                    multiple=True,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
+            ): _WEEKDAYS_SELECTOR,
         }
         bs_key = vol.Optional(CONF_SCHEDULE_BINARY_SENSOR, description={"suggested_value": current_bs}) if current_bs else vol.Optional(CONF_SCHEDULE_BINARY_SENSOR)
-        schema[bs_key] = selector.EntitySelector(selector.EntitySelectorConfig(domain="binary_sensor"))
+        schema[bs_key] = _BINARY_SENSOR_SELECTOR
 
         current_cs = current.get(CONF_CONTROL_BINARY_SENSOR, "")
         cs_key = vol.Optional(CONF_CONTROL_BINARY_SENSOR, description={"suggested_value": current_cs}) if current_cs else vol.Optional(CONF_CONTROL_BINARY_SENSOR)
-        schema[cs_key] = selector.EntitySelector(selector.EntitySelectorConfig(domain="binary_sensor"))
+        schema[cs_key] = _BINARY_SENSOR_SELECTOR
 
         return self.async_show_form(
             step_id="control",
@@ -697,35 +563,19 @@ class AdvancedSwitchesOptionsFlow(OptionsFlow):
                     vol.Required(
                         CONF_AUTO_OFF_ENABLED,
                         default=current.get(CONF_AUTO_OFF_ENABLED, DEFAULT_AUTO_OFF_ENABLED),
-                    ): selector.BooleanSelector(),
+                    ): _BOOLEAN_SELECTOR,
                     vol.Required(
                         CONF_AUTO_OFF_MINUTES,
                         default=current.get(CONF_AUTO_OFF_MINUTES, DEFAULT_AUTO_OFF_MINUTES),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=1440,
-                            step=1,
-                            unit_of_measurement="min",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
+                    ): _MINUTES_SELECTOR,
                     vol.Required(
                         CONF_AUTO_OFF_STANDBY_ENABLED,
                         default=current.get(CONF_AUTO_OFF_STANDBY_ENABLED, DEFAULT_AUTO_OFF_STANDBY_ENABLED),
-                    ): selector.BooleanSelector(),
+                    ): _BOOLEAN_SELECTOR,
                     vol.Required(
                         CONF_AUTO_OFF_STANDBY_MINUTES,
                         default=current.get(CONF_AUTO_OFF_STANDBY_MINUTES, DEFAULT_AUTO_OFF_STANDBY_MINUTES),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=1440,
-                            step=1,
-                            unit_of_measurement="min",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
+                    ): _MINUTES_SELECTOR,
                 }
             ),
         )
@@ -759,23 +609,5 @@ class AdvancedSwitchesOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="reset",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional("reset_all", default=False): selector.BooleanSelector(
-                        selector.BooleanSelectorConfig()
-                    ),
-                    vol.Optional("reset_today", default=False): selector.BooleanSelector(
-                        selector.BooleanSelectorConfig()
-                    ),
-                    vol.Optional("reset_total", default=False): selector.BooleanSelector(
-                        selector.BooleanSelectorConfig()
-                    ),
-                    vol.Optional("reset_last_session", default=False): selector.BooleanSelector(
-                        selector.BooleanSelectorConfig()
-                    ),
-                    vol.Optional("reset_history", default=False): selector.BooleanSelector(
-                        selector.BooleanSelectorConfig()
-                    ),
-                }
-            ),
+            data_schema=_RESET_SCHEMA,
         )
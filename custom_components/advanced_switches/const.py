@@ -1,4 +1,6 @@
 """Constants for Advanced Switches integration."""
+from enum import IntEnum
+
 from homeassistant.const import Platform
 
 DOMAIN = "advanced_switches"
@@ -77,12 +79,34 @@ DEFAULT_AUTO_OFF_STANDBY_MINUTES = 60
 # Session history
 SESSION_HISTORY_SIZE = 10
 
+# Power processing
+MIN_SMOOTHING_READINGS = 5  # Minimum readings kept for a stable average
+POWER_DEBOUNCE_S = 0.25  # Coalesce bursts of power updates
+
+# Timers
+TIMER_TOLERANCE_S = 0.05  # Timers firing this close to their deadline are due
+
+# Entity updates
+NOTIFY_COALESCE_S = 0.1  # Batch window for entity notifications
+
 # States
 STATE_OFF = "off"
 STATE_STANDBY = "standby"
 STATE_ACTIVE = "active"
 STATE_BLOCKED = "blocked"  # Outside schedule
 
+
+class DeviceState(IntEnum):
+    """Internal device state."""
+
+    OFF = 0
+    STANDBY = 1
+    ACTIVE = 2
+
+
+# Exposed state per DeviceState (indexed by value)
+DEVICE_STATE_NAMES = (STATE_OFF, STATE_STANDBY, STATE_ACTIVE)
+
 # Attributes for persistence
 ATTR_SESSIONS_TOTAL = "sessions_total"
 ATTR_SESSIONS_TODAY = "sessions_today"
@@ -13,12 +13,11 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfEnergy, UnitOfPower, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AdvancedSwitchController
 from .const import (
-    CONF_DEVICE_NAME,
     DOMAIN,
     STATE_ACTIVE,
     STATE_BLOCKED,
@@ -90,6 +89,7 @@ class BaseEntity(SensorEntity):
 
     _attr_should_poll = False
     _attr_has_entity_name = True
+    _unique_id_suffix: str  # Appended to the entry ID
 
     def __init__(
         self,
@@ -99,30 +99,17 @@ class BaseEntity(SensorEntity):
         """Initialize the sensor."""
         self._ctrl = controller
         self._entry = entry
-
-        # Link to source device if available, otherwise create virtual device
-        source_identifiers = controller.get_source_device_identifiers()
-        if source_identifiers:
-            self._attr_device_info = DeviceInfo(
-                identifiers=source_identifiers,
-            )
-        else:
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, entry.entry_id)},
-                name=entry.data[CONF_DEVICE_NAME],
-                manufacturer="Advanced Switches",
-                model="Virtual Device",
-            )
+        self._attr_unique_id = entry.entry_id + self._unique_id_suffix
+        self._attr_device_info = controller.device_info
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
         await super().async_added_to_hass()
-        self._ctrl.register_entity_listener(self._on_controller_update)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unregister callbacks when entity is removed."""
-        self._ctrl.unregister_entity_listener(self._on_controller_update)
-        await super().async_will_remove_from_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._ctrl.update_signal, self._on_controller_update
+            )
+        )
 
     @callback
     def _on_controller_update(self) -> None:
@@ -136,15 +123,7 @@ class StateSensor(BaseEntity):
     _attr_translation_key = "state"
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_options = [STATE_OFF, STATE_STANDBY, STATE_ACTIVE, STATE_BLOCKED]
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_state"
+    _unique_id_suffix = "_state"
 
     @property
     def native_value(self) -> str:
@@ -196,15 +175,7 @@ class SessionsTotalSensor(RestoreSensor, BaseEntity):
     _attr_translation_key = "sessions_total"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_icon = "mdi:counter"
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sessions_total"
+    _unique_id_suffix = "_sessions_total"
 
     async def async_added_to_hass(self) -> None:
         """Restore state and register callbacks."""
@@ -231,15 +202,7 @@ class SessionsTodaySensor(BaseEntity):
     _attr_translation_key = "sessions_today"
     _attr_state_class = SensorStateClass.TOTAL
     _attr_icon = "mdi:counter"
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sessions_today"
+    _unique_id_suffix = "_sessions_today"
 
     @property
     def native_value(self) -> int:
@@ -252,15 +215,7 @@ class LastSessionDurationSensor(BaseEntity):
 
     _attr_translation_key = "last_session_duration"
     _attr_icon = "mdi:timer-outline"
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_last_session_duration"
+    _unique_id_suffix = "_last_session_duration"
 
     @property
     def native_value(self) -> str:
@@ -282,15 +237,7 @@ class LastSessionEnergySensor(BaseEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:lightning-bolt"
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_last_session_energy"
+    _unique_id_suffix = "_last_session_energy"
 
     @property
     def native_value(self) -> float:
@@ -307,15 +254,7 @@ class LastSessionPeakPowerSensor(BaseEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:flash-triangle"
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_last_session_peak_power"
+    _unique_id_suffix = "_last_session_peak_power"
 
     @property
     def native_value(self) -> float:
@@ -332,15 +271,7 @@ class EnergyTodaySensor(BaseEntity):
     _attr_state_class = SensorStateClass.TOTAL
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:flash"
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_energy_today"
+    _unique_id_suffix = "_energy_today"
 
     @property
     def native_value(self) -> float:
@@ -357,15 +288,7 @@ class EnergyTotalSensor(BaseEntity):
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:lightning-bolt"
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_energy_total"
+    _unique_id_suffix = "_energy_total"
 
     @property
     def native_value(self) -> float:
@@ -381,15 +304,7 @@ class CurrentSessionDurationSensor(BaseEntity):
     _attr_translation_key = "current_session_duration"
     _attr_icon = "mdi:timer-play"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_current_session_duration"
+    _unique_id_suffix = "_current_session_duration"
 
     @property
     def native_value(self) -> str:
@@ -411,15 +326,7 @@ class CurrentSessionEnergySensor(BaseEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:lightning-bolt-circle"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_current_session_energy"
+    _unique_id_suffix = "_current_session_energy"
 
     @property
     def native_value(self) -> float:
@@ -437,15 +344,7 @@ class CurrentSessionPeakPowerSensor(BaseEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:flash-triangle-outline"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_current_session_peak_power"
+    _unique_id_suffix = "_current_session_peak_power"
 
     @property
     def native_value(self) -> float:
@@ -463,15 +362,7 @@ class AvgSessionDurationSensor(BaseEntity):
     _attr_translation_key = "avg_session_duration"
     _attr_icon = "mdi:timer-sand"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_avg_session_duration"
+    _unique_id_suffix = "_avg_session_duration"
 
     @property
     def native_value(self) -> str | None:
@@ -497,15 +388,7 @@ class AvgSessionEnergySensor(BaseEntity):
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_icon = "mdi:chart-line"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_avg_session_energy"
+    _unique_id_suffix = "_avg_session_energy"
 
     @property
     def native_value(self) -> float | None:
@@ -519,15 +402,7 @@ class AutoOffRemainingSensor(BaseEntity):
     _attr_translation_key = "auto_off_remaining"
     _attr_icon = "mdi:timer-sand"
     _attr_should_poll = True  # Enable polling for countdown updates
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_auto_off_remaining"
+    _unique_id_suffix = "_auto_off_remaining"
 
     @property
     def suggested_object_id(self) -> str:
@@ -595,15 +470,7 @@ class SmoothedPowerSensor(BaseEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:chart-line-variant"
     _attr_suggested_display_precision = 1
-
-    def __init__(
-        self,
-        controller: AdvancedSwitchController,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(controller, entry)
-        self._attr_unique_id = f"{entry.entry_id}_smoothed_power"
+    _unique_id_suffix = "_smoothed_power"
 
     @property
     def native_value(self) -> float: